@@ -100,8 +100,25 @@ class DatabaseManager:
                     except Exception as e:
                         logger.error(f"Failed to add column {table_name}.{column_name}: {e}")
 
-        if migrations_applied > 0:
-            logger.info(f"Schema migrations complete: {migrations_applied} column(s) added")
+        # Create indexes defined on models after their tables already existed
+        indexes_created = 0
+        for table_name in sorted(metadata_tables - missing_tables):
+            existing_indexes = {idx["name"] for idx in inspector.get_indexes(table_name)}
+            for index in Base.metadata.tables[table_name].indexes:
+                if index.name not in existing_indexes:
+                    logger.info(f"Creating missing index '{index.name}' on {table_name}")
+                    try:
+                        index.create(self.engine)
+                        indexes_created += 1
+                        logger.info(f"✓ Created index {index.name}")
+                    except Exception as e:
+                        logger.error(f"Failed to create index {index.name}: {e}")
+
+        if migrations_applied > 0 or indexes_created > 0:
+            logger.info(
+                f"Schema migrations complete: {migrations_applied} column(s) added, "
+                f"{indexes_created} index(es) created"
+            )
         elif not missing_tables:
             logger.debug("Schema is up to date, no migrations needed")
 
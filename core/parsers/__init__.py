@@ -5,6 +5,7 @@ Centralized location for all parsing logic.
 from core.parsers.categorizer import FileCategorizer
 from core.parsers.country import ISO_COUNTRIES, detect_country, find_country
 from core.parsers.date import (
+    MONTH_ABBREVIATIONS,
     MONTH_NAME_MAPPING,
     MONTH_NUMBER_MAPPING,
     month_abbr_to_number,
@@ -52,6 +53,7 @@ __all__ = [
     "detect_country",
     "find_country",
     # Date parsing
+    "MONTH_ABBREVIATIONS",
     "MONTH_NAME_MAPPING",
     "MONTH_NUMBER_MAPPING",
     "normalize_month_name",
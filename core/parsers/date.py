@@ -35,6 +35,9 @@ MONTH_NUMBER_MAPPING = {
     "Dec": 12,
 }
 
+# Index by month number (1-12); locale-independent alternative to strftime("%b")
+MONTH_ABBREVIATIONS = ("",) + tuple(MONTH_NUMBER_MAPPING)
+
 
 def normalize_month_name(month_str: str) -> str:
     """
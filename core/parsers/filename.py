@@ -6,6 +6,11 @@ from typing import Any, Dict, Optional
 
 from core.parsers.date import month_abbr_to_number
 
+# "{Magazine Title} - {Abbr}{Year}", e.g. "Wired Magazine - Dec2006"
+_METADATA_PATTERN = re.compile(r"^(.+?)\s*-\s*([A-Za-z]{3})(\d{4})$")
+# Deletes the characters that are invalid on at least one supported filesystem
+_INVALID_CHARS_TABLE = str.maketrans("", "", '<>:"/\\|?*')
+
 
 def parse_filename_for_metadata(filename: str) -> Dict[str, Any]:
     """
@@ -22,8 +27,7 @@ def parse_filename_for_metadata(filename: str) -> Dict[str, Any]:
     Returns:
         Dict with extracted metadata (title, month, year)
     """
-    pattern = r"^(.+?)\s*-\s*([A-Za-z]{3})(\d{4})$"
-    match = re.match(pattern, filename)
+    match = _METADATA_PATTERN.match(filename)
 
     if match:
         title, month_abbr, year = match.groups()
@@ -66,8 +70,7 @@ def sanitize_filename(filename: str, max_length: Optional[int] = 200) -> str:
         'TestPathFile.pdf'
     """
     # Remove invalid filesystem characters
-    invalid_chars = r'[<>:"/\\|?*]'
-    sanitized = re.sub(invalid_chars, "", filename)
+    sanitized = filename.translate(_INVALID_CHARS_TABLE)
 
     # Remove leading/trailing spaces
     sanitized = sanitized.strip()
@@ -1,6 +1,7 @@
 """Title matching and deduplication."""
 import logging
 import re
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 
 from fuzzywuzzy import fuzz
@@ -9,6 +10,86 @@ from core.parsers.language import LANGUAGE_INDICATORS
 
 logger = logging.getLogger(__name__)
 
+# Language names/codes appearing as words (spaces, dots, etc. on either side)
+_LANGUAGE_PATTERN = re.compile(
+    r'[\s\.](?:' + '|'.join(
+        re.escape(indicator)  # Escape special regex chars in indicators
+        for indicators in LANGUAGE_INDICATORS.values()
+        for indicator in indicators
+    ) + r')(?:[\s\.]|$)',
+    re.IGNORECASE,
+)
+
+
+# Release-noise removal for clean_release_title, applied in order before dots become spaces
+_RELEASE_NOISE_SUBS = [
+    # File extension
+    (re.compile(r'\.[a-z0-9]{2,4}$', re.IGNORECASE), ''),
+    # Website prefixes: [www.site.com] or www.site.com -
+    (re.compile(
+        r'^(?:\[\s*)?(?:www\.)?[-a-z0-9-]{1,256}\.'
+        r'(?:[a-z]{2,6}(?:\.[a-z]{2,6})?|xn--[a-z0-9-]{4,})\b(?:\s*\]|[-\s]{1,})',
+        re.IGNORECASE,
+    ), ''),
+    # Website postfixes: www.site.com] at end
+    (re.compile(
+        r'(?:\[\s*)?(?:www\.)?[-a-z0-9-]{1,256}\.(?:xn--[a-z0-9-]{4,}|[a-z]{2,6})(?:\s*\])?$',
+        re.IGNORECASE,
+    ), ''),
+    # Torrent tracker suffixes like [ettv], [rartv], [rarbg]
+    (re.compile(r'\[(?:ettv|rartv|rarbg|cttv|eztv)\]$', re.IGNORECASE), ''),
+    # Common download/unpack prefixes
+    (re.compile(r'^(?:Unpack|Download|Get|Read)\s+', re.IGNORECASE), ''),
+    # Language indicators (German, French, etc.) that appear as words
+    (_LANGUAGE_PATTERN, ' '),
+    # Release group tags (e.g., "-LORENZ-xpost", "[hash]-xpost") - BEFORE quality removal
+    (re.compile(r'-[A-Z][A-Za-z0-9]+(?:-[a-z]+)?\[[\w]+\].*$'), ''),  # -LORENZ[hash]
+    (re.compile(r'\[[\w]+\](?:-[a-z]+)?$'), ''),  # [hash]-xpost or [hash]
+    (re.compile(r'-[A-Z][A-Za-z0-9]+(?:-[a-z]+)?$'), ''),  # -LORENZ-xpost or -LORENZ
+    # Quality indicators (480p, 720p, 1080p, 2160p, x264, x265, h264, h265, DD5.1, 10bit, etc.)
+    # and common scene release tags, removed in one sweep
+    (re.compile(
+        r'[\.\s]*(?:(?:480|720|1080|2160|320)[ip]|[xh][\W_]?26[45]|DD[\W_]?5[\W_]?1|(?:8|10)bit'
+        r'|READNFO|REPACK|PROPER|REAL|RETAIL|EXTENDED|UNRATED)',
+        re.IGNORECASE,
+    ), ''),
+    # Percentages (95%, etc.)
+    (re.compile(r'(\d+)%'), r'\1'),
+    # Multiple dots or spaces
+    (re.compile(r'\.{2,}'), '.'),
+    (re.compile(r'\s{2,}'), ' '),
+]
+
+# Title formatting for clean_release_title, applied in order after dots/underscores become spaces
+_TITLE_FORMAT_SUBS = [
+    # camelCase: "NationalGeographic" -> "National Geographic"
+    (re.compile(r"([a-z])([A-Z])"), r"\1 \2"),
+    # Issue numbers that appear as metadata: "No 123", "Issue 456", "No.789", "#42", "Vol 5", "Vol.5"
+    (re.compile(
+        r'\s+(?:No|Issue|Vol|Volume|Edition)\s+\d+\s+(?:(?:19|20)\d{2}|German|Hybrid|Digital|PDF)', re.IGNORECASE
+    ), ''),
+    (re.compile(r'\s+(?:No|Issue|Vol|Volume|Edition)\s+\d+', re.IGNORECASE), ''),  # Remove remaining
+    (re.compile(r'\s+#\d+(?:\s+(?:19|20)\d{2})?$', re.IGNORECASE), ''),
+    # Magazine type suffixes (often redundant metadata like "Hybrid Magazine", "Digital Magazine")
+    (re.compile(r"\s+(?:Hybrid|Digital|PDF|eMag|True|HQ)\s+(?:Magazine|Mag)", re.IGNORECASE), ""),
+    (re.compile(r"\s+(magazine|mag|mag\.)$", re.IGNORECASE), ""),
+    # Standalone format indicators (E Book, eBook, Digital, PDF, etc.)
+    (re.compile(r"\s+(?:E\s*Book|eBook|Digital|PDF|ePub)(?:\s+|$)", re.IGNORECASE), " "),
+]
+
+_WHITESPACE_RUN = re.compile(r"\s+")
+
+# Periodicals whose canonical casing str.title() would get wrong, keyed by lowercased title
+_COMMON_TITLES = {
+    "national geographic": "National Geographic",
+    "pcgamer": "PC Gamer",
+    "pc gamer": "PC Gamer",
+    "pc world": "PC World",
+    "mac world": "Mac World",
+    "e-news": "E-News",
+    "wired": "Wired",
+}
+
 
 class TitleMatcher:
     """Fuzzy title matching for deduplication"""
@@ -97,109 +178,7 @@ class TitleMatcher:
         Returns:
             Cleaned title ready for parsing
         """
-        if not title:
-            return title
-
-        # Remove file extension
-        title = re.sub(r'\.[a-z0-9]{2,4}$', '', title, flags=re.IGNORECASE)
-
-        # Remove website prefixes: [www.site.com] or www.site.com -
-        title = re.sub(
-            r'^(?:\[\s*)?(?:www\.)?[-a-z0-9-]{1,256}\.'
-            r'(?:[a-z]{2,6}(?:\.[a-z]{2,6})?|xn--[a-z0-9-]{4,})\b(?:\s*\]|[-\s]{1,})',
-            '', title, flags=re.IGNORECASE
-        )
-
-        # Remove website postfixes: www.site.com] at end
-        title = re.sub(
-            r'(?:\[\s*)?(?:www\.)?[-a-z0-9-]{1,256}\.(?:xn--[a-z0-9-]{4,}|[a-z]{2,6})(?:\s*\])?$',
-            '', title, flags=re.IGNORECASE
-        )
-
-        # Remove torrent tracker suffixes like [ettv], [rartv], [rarbg]
-        title = re.sub(r'\[(?:ettv|rartv|rarbg|cttv|eztv)\]$', '', title, flags=re.IGNORECASE)
-
-        # Remove common download/unpack prefixes
-        title = re.sub(r'^(?:Unpack|Download|Get|Read)\s+', '', title, flags=re.IGNORECASE)
-
-        # Remove language indicators (German, French, etc.) that appear as words
-        # Pattern matches language names/codes with word boundaries (spaces, dots, etc.)
-        language_pattern = r'[\s\.](?:' + '|'.join([
-            re.escape(indicator)  # Escape special regex chars in indicators
-            for indicators in LANGUAGE_INDICATORS.values()
-            for indicator in indicators
-        ]) + r')(?:[\s\.]|$)'
-        title = re.sub(language_pattern, ' ', title, flags=re.IGNORECASE)
-
-        # Remove release group tags (e.g., "-LORENZ-xpost", "[hash]-xpost") - BEFORE quality removal
-        title = re.sub(r'-[A-Z][A-Za-z0-9]+(?:-[a-z]+)?\[[\w]+\].*$', '', title)  # -LORENZ[hash]
-        title = re.sub(r'\[[\w]+\](?:-[a-z]+)?$', '', title)  # [hash]-xpost or [hash]
-        title = re.sub(r'-[A-Z][A-Za-z0-9]+(?:-[a-z]+)?$', '', title)  # -LORENZ-xpost or -LORENZ
-
-        # Remove quality indicators (480p, 720p, 1080p, 2160p, x264, x265, h264, h265, DD5.1, 10bit, etc.)
-        title = re.sub(
-            r'[\.\s]*(480|720|1080|2160|320)[ip]',
-            '', title, flags=re.IGNORECASE
-        )
-        title = re.sub(r'[\.\s]*[xh][\W_]?26[45]', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'[\.\s]*DD[\W_]?5[\W_]?1', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'[\.\s]*(8|10)bit', '', title, flags=re.IGNORECASE)
-
-        # Remove common scene release tags
-        release_tags = ['READNFO', 'REPACK', 'PROPER', 'REAL', 'RETAIL', 'EXTENDED', 'UNRATED']
-        for tag in release_tags:
-            title = re.sub(rf'[\.\s]*{tag}', '', title, flags=re.IGNORECASE)
-
-        # Remove percentages (95%, etc.)
-        title = re.sub(r'(\d+)%', r'\1', title)
-
-        # Clean up multiple dots or spaces
-        title = re.sub(r'\.{2,}', '.', title)
-        title = re.sub(r'\s{2,}', ' ', title)
-
-        # === Formatting (formerly in standardize_title) ===
-
-        # Replace dots and underscores with spaces
-        title = title.replace(".", " ").replace("_", " ")
-
-        # Handle camelCase by inserting spaces before uppercase letters
-        # followed by lowercase letters (e.g., "NationalGeographic" -> "National Geographic")
-        title = re.sub(r"([a-z])([A-Z])", r"\1 \2", title)
-
-        # Remove issue numbers that appear as metadata: "No 123", "Issue 456", "No.789", "#42", "Vol 5", "Vol.5"
-        # Must do this AFTER replacing dots with spaces
-        title = re.sub(r'\s+(?:No|Issue|Vol|Volume|Edition)\s+\d+\s+(?:(?:19|20)\d{2}|German|Hybrid|Digital|PDF)', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'\s+(?:No|Issue|Vol|Volume|Edition)\s+\d+', '', title, flags=re.IGNORECASE)  # Remove remaining
-        title = re.sub(r'\s+#\d+(?:\s+(?:19|20)\d{2})?$', '', title, flags=re.IGNORECASE)
-
-        # Remove magazine type suffixes (often redundant metadata like "Hybrid Magazine", "Digital Magazine")
-        title = re.sub(r"\s+(?:Hybrid|Digital|PDF|eMag|True|HQ)\s+(?:Magazine|Mag)", "", title, flags=re.IGNORECASE)
-        title = re.sub(r"\s+(magazine|mag|mag\.)$", "", title, flags=re.IGNORECASE)
-
-        # Remove standalone format indicators (E Book, eBook, Digital, PDF, etc.)
-        title = re.sub(r"\s+(?:E\s*Book|eBook|Digital|PDF|ePub)(?:\s+|$)", " ", title, flags=re.IGNORECASE)
-
-        # Clean up multiple spaces again after replacements
-        title = re.sub(r"\s+", " ", title).strip()
-
-        # Title case (capitalize first letter of each word)
-        # But preserve special formatting for common periodicals
-        common_titles = {
-            "national geographic": "National Geographic",
-            "pcgamer": "PC Gamer",
-            "pc gamer": "PC Gamer",
-            "pc world": "PC World",
-            "mac world": "Mac World",
-            "e-news": "E-News",
-            "wired": "Wired",
-        }
-
-        title_lower = title.lower()
-        if title_lower in common_titles:
-            return common_titles[title_lower]
-
-        # Default title case for others
-        return title.title()
+        return _clean_release_title(title)
 
     def parse_with_patterns(self, title: str) -> Optional[Dict[str, str]]:
         """
@@ -258,15 +237,23 @@ class TitleMatcher:
             best_match_idx = -1
             best_score = 0.0
             current_pos = 0
+            pattern_len = len(pattern_lower)
+            window = len(words_pattern)
 
             for i, word in enumerate(words_text):
                 # Check if this word starts a potential match
-                candidate = ' '.join(words_text[i:i + len(words_pattern)])
-                score = fuzz.ratio(candidate.lower(), pattern_lower) / 100.0
+                candidate = ' '.join(words_text[i:i + window]).lower()
+
+                # ratio() can't exceed 2 * shorter / combined length, so skip
+                # windows whose lengths alone rule out beating the best score
+                candidate_len = len(candidate)
+                max_score = round(200 * min(candidate_len, pattern_len) / (candidate_len + pattern_len)) / 100.0
+                if max_score > best_score:
+                    score = fuzz.ratio(candidate, pattern_lower) / 100.0
 
-                if score > best_score:
-                    best_score = score
-                    best_match_idx = current_pos
+                    if score > best_score:
+                        best_score = score
+                        best_match_idx = current_pos
 
                 current_pos += len(word) + 1  # +1 for delimiter
 
@@ -415,29 +402,58 @@ class TitleMatcher:
             Dict mapping group_id to list of results in that group
         """
         groups = {}
-        group_counter = 0
+        # (group_id, lowercased first title) per group, so each sample is
+        # normalized once instead of on every comparison
+        samples: List[Tuple[str, str]] = []
+        threshold = self.threshold
+        scorer = fuzz.token_set_ratio
 
         for result in results:
-            title = result.get("title", "")
-            matched = False
-
-            # Try to match with existing groups
-            for group_id, group_results in groups.items():
-                if group_results:
-                    sample_title = group_results[0].get("title", "")
-                    is_match, score = self.match(title, sample_title)
-
-                    if is_match:
-                        result["match_score"] = score
-                        groups[group_id].append(result)
-                        matched = True
-                        break
-
-            # Create new group if no match found
-            if not matched:
-                group_id = f"group_{group_counter}"
-                group_counter += 1
+            title = result.get("title", "").lower()
+
+            # Try to match with existing groups, first match wins
+            for group_id, sample_title in samples:
+                score = scorer(title, sample_title)
+                if score >= threshold:
+                    result["match_score"] = score
+                    groups[group_id].append(result)
+                    break
+            else:
+                # Create new group if no match found
+                group_id = f"group_{len(samples)}"
+                samples.append((group_id, title))
                 result["match_score"] = 100
                 groups[group_id] = [result]
 
         return groups
+
+
+@lru_cache(maxsize=8192)
+def _clean_release_title(title: str) -> str:
+    """Cached implementation of TitleMatcher.clean_release_title"""
+    if not title:
+        return title
+
+    for pattern, repl in _RELEASE_NOISE_SUBS:
+        title = pattern.sub(repl, title)
+
+    # === Formatting (formerly in standardize_title) ===
+
+    # Replace dots and underscores with spaces
+    title = title.replace(".", " ").replace("_", " ")
+
+    # Must run AFTER replacing dots with spaces
+    for pattern, repl in _TITLE_FORMAT_SUBS:
+        title = pattern.sub(repl, title)
+
+    # Clean up multiple spaces again after replacements
+    title = _WHITESPACE_RUN.sub(" ", title).strip()
+
+    # Title case (capitalize first letter of each word)
+    # But preserve special formatting for common periodicals
+    common_title = _COMMON_TITLES.get(title.lower())
+    if common_title:
+        return common_title
+
+    # Default title case for others
+    return title.title()
@@ -17,6 +17,31 @@ logger = logging.getLogger(__name__)
 # Needed for 300 DPI magazine covers which can be ~130 MP
 Image.MAX_IMAGE_PIXELS = 200000000  # 200 megapixels
 
+# PDF header searched for by has_pdf_signature
+PDF_SIGNATURE = b"%PDF-"
+
+
+def has_pdf_signature(pdf_path: Path) -> bool:
+    """
+    Check for a PDF header in the first 1024 bytes, without parsing the file.
+
+    The header is searched for rather than required at offset 0 because PDF
+    readers (following Adobe's implementation notes) accept leading junk
+    before it, such as bytes left by a download wrapper, as long as the
+    header appears within the first KiB.
+
+    Args:
+        pdf_path: Path to file
+
+    Returns:
+        True if the PDF signature is found, False otherwise
+    """
+    try:
+        with open(pdf_path, "rb") as f:
+            return PDF_SIGNATURE in f.read(1024)
+    except OSError:
+        return False
+
 
 def extract_cover_from_pdf(
     pdf_path: Path,
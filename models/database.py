@@ -8,6 +8,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
 )
@@ -64,6 +65,11 @@ class Magazine(Base):
     updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
     tracking_id = Column(Integer, ForeignKey("periodical_tracking.id"), nullable=True, index=True)  # Link to tracking record
 
+    __table_args__ = (
+        # Library grouping: latest issue per title
+        Index("ix_periodicals_title_date", "title", "issue_date"),
+    )
+
 
 class MagazineTracking(Base):
     """Track periodical series for monitoring and downloading specific editions"""
@@ -163,6 +169,12 @@ class DownloadSubmission(Base):
     created_at = Column(DateTime, default=utcnow, index=True)
     updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
 
+    __table_args__ = (
+        # Per-periodical status lookups and duplicate checks
+        Index("ix_dl_tracking_status", "tracking_id", "status"),
+        Index("ix_dl_tracking_group", "tracking_id", "fuzzy_match_group"),
+    )
+
 
 class Download(Base):
     """Track downloads from clients (legacy - for backward compatibility)"""
@@ -5,7 +5,7 @@ Background task scheduler for automated file imports and maintenance.
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Callable
+from typing import Awaitable, Callable
 
 logger = logging.getLogger(__name__)
 
@@ -13,11 +13,22 @@ logger = logging.getLogger(__name__)
 class TaskScheduler:
     """Simple task scheduler for background jobs"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        now: Callable[[], datetime] = datetime.now,
+        sleep: Callable[[float], Awaitable] = asyncio.sleep,
+    ):
+        """
+        Args:
+            now: Clock used to decide when tasks are due
+            sleep: Coroutine used to wait between checks
+        """
         self.tasks = {}
         self.running = False
+        self._now = now
+        self._sleep = sleep
 
-    def schedule_periodic(self, name: str, task_func: Callable, interval_seconds: int):
+    def schedule_periodic(self, name: str, task_func: Callable, interval_seconds: float):
         """
         Schedule a task to run periodically.
 
@@ -30,7 +41,7 @@ class TaskScheduler:
             "func": task_func,
             "interval": interval_seconds,
             "last_run": None,
-            "next_run": datetime.now(),
+            "next_run": self._now(),
         }
         logger.info(f"Scheduled task: {name} (every {interval_seconds}s)")
 
@@ -44,7 +55,7 @@ class TaskScheduler:
 
         try:
             while self.running:
-                now = datetime.now()
+                now = self._now()
 
                 for task_name, task_info in self.tasks.items():
                     if now >= task_info["next_run"]:
@@ -77,7 +88,7 @@ class TaskScheduler:
                             )
 
                 # Sleep for a short interval
-                await asyncio.sleep(1)
+                await self._sleep(1)
 
         except asyncio.CancelledError:
             logger.info("Task scheduler cancelled")
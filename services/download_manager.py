@@ -9,6 +9,7 @@ import re
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from typing import Any, Dict, List, Optional, Tuple
 
+from sqlalchemy import exists, func, or_, select
 from sqlalchemy.orm import Session
 
 from core.bases import DownloadClient, SearchProvider
@@ -31,6 +32,31 @@ from models.database import SearchResult as DBSearchResult
 
 logger = logging.getLogger(__name__)
 
+# Polled on every status check; built once so each call reuses the cached compiled SQL
+_PENDING_SUBMISSIONS = select(DownloadSubmission).where(
+    DownloadSubmission.status.in_(
+        [
+            DownloadSubmission.StatusEnum.PENDING,
+            DownloadSubmission.StatusEnum.DOWNLOADING,
+        ]
+    )
+)
+_COMPLETED_SUBMISSIONS = select(DownloadSubmission).where(
+    DownloadSubmission.status == DownloadSubmission.StatusEnum.COMPLETED,
+    DownloadSubmission.file_path.isnot(None),
+)
+
+# Tracked periodicals the auto-download task checks: tracking enabled, or at least one
+# edition selected (a true value in the selected_editions JSON object)
+_SELECTED_EDITIONS = func.json_each(MagazineTracking.selected_editions).table_valued("value")
+_AUTO_DOWNLOAD_TRACKING = select(MagazineTracking).where(
+    or_(
+        MagazineTracking.track_all_editions.is_(True),
+        MagazineTracking.track_new_only.is_(True),
+        exists().select_from(_SELECTED_EDITIONS).where(_SELECTED_EDITIONS.c.value == 1),
+    )
+)
+
 
 class DownloadManager:
     """Manage downloads for tracked periodicals"""
@@ -267,19 +293,19 @@ class DownloadManager:
         result_language = parsed.language
 
         # Check if this tracking_title with this language already exists in library
-        in_library = (
-            session.query(Magazine)
+        in_library = session.query(
+            session.query(Magazine.id)
             .filter(
                 Magazine.tracking_id == tracking_id,
                 Magazine.title == tracking_title,
                 Magazine.language == result_language,
             )
-            .first()
-        )
+            .exists()
+        ).scalar()
 
         if in_library:
             logger.debug(
-                f"Skipping duplicate: '{result_title}' already in library as '{in_library.title}'"
+                f"Skipping duplicate: '{result_title}' already in library as '{tracking_title}'"
             )
             return True, None
 
@@ -834,14 +860,7 @@ class DownloadManager:
         Returns:
             List of completed submissions with file paths
         """
-        completed = (
-            session.query(DownloadSubmission)
-            .filter(
-                DownloadSubmission.status == DownloadSubmission.StatusEnum.COMPLETED,
-                DownloadSubmission.file_path.isnot(None),
-            )
-            .all()
-        )
+        completed = session.execute(_COMPLETED_SUBMISSIONS).scalars().all()
 
         return completed
 
@@ -874,6 +893,18 @@ class DownloadManager:
         logger.info(f"Marked submission as processed: {submission_id}")
         return True
 
+    def get_auto_download_tracking(self, session: Session) -> List[MagazineTracking]:
+        """
+        Get tracked periodicals that auto-download should check for new issues.
+
+        Args:
+            session: Database session
+
+        Returns:
+            Tracking records with all/new-only tracking or at least one selected edition
+        """
+        return session.execute(_AUTO_DOWNLOAD_TRACKING).scalars().all()
+
     def get_pending_downloads(self, session: Session) -> List[DownloadSubmission]:
         """
         Get all pending/downloading submissions to monitor.
@@ -884,18 +915,7 @@ class DownloadManager:
         Returns:
             List of active submissions
         """
-        pending = (
-            session.query(DownloadSubmission)
-            .filter(
-                DownloadSubmission.status.in_(
-                    [
-                        DownloadSubmission.StatusEnum.PENDING,
-                        DownloadSubmission.StatusEnum.DOWNLOADING,
-                    ]
-                )
-            )
-            .all()
-        )
+        pending = session.execute(_PENDING_SUBMISSIONS).scalars().all()
         logger.debug(f"Found {len(pending)} pending submissions")
         return pending
 
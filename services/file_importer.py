@@ -8,7 +8,7 @@ import re
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy.orm import Session
 
@@ -19,7 +19,7 @@ from core.constants import (
 )
 from core.parsers import generate_language_aware_olid
 from core.parsers import TitleMatcher, FileCategorizer, UnifiedParser
-from core.pdf_utils import extract_cover_from_pdf
+from core.pdf_utils import extract_cover_from_pdf, has_pdf_signature
 from core.epub_utils import extract_cover_from_epub
 from core.utils import find_pdf_epub_files, hash_file_in_chunks
 from core.response_models import ErrorCodes, OperationResult
@@ -30,6 +30,10 @@ from services.ocr_service import OCRService
 logger = logging.getLogger(__name__)
 
 
+class _ImportFailed(Exception):
+    """Raised inside import_many's savepoint to roll back a failed import"""
+
+
 class FileImporter:
     """Import and process PDF files from downloads folder"""
 
@@ -186,7 +190,8 @@ class FileImporter:
         auto_track: bool = True,
         skip_organize: bool = False,
         tracking_mode: str = "watch",
-    ) -> bool:
+        commit: bool = True,
+    ) -> Optional[Magazine]:
         """
         Import a single PDF file.
 
@@ -197,9 +202,10 @@ class FileImporter:
             auto_track: Whether to auto-create tracking records for imported periodicals
             skip_organize: If True, skip file organization and use file in place (for already-organized files)
             tracking_mode: Tracking mode - "all" (track all editions), "new" (track new only), "watch" (watch only), "none" (no tracking)
+            commit: If False, only flush and leave commit/rollback to the caller (see import_many)
 
         Returns:
-            True if successful, False otherwise
+            The imported Magazine if successful, None otherwise
         """
         try:
             # Parse file using unified parser - combines filename and filepath parsing
@@ -210,7 +216,7 @@ class FileImporter:
                 logger.warning(
                     f"Skipping invalid release title: {parsed.title} (from {pdf_path.name})"
                 )
-                return False
+                return None
 
             logger.debug(f"Parsed metadata: '{parsed.title}' (confidence: {parsed.confidence})")
 
@@ -218,7 +224,7 @@ class FileImporter:
             content_hash = hash_file_in_chunks(str(pdf_path))
             if not content_hash:
                 logger.error(f"Failed to hash file {pdf_path}, skipping import")
-                return False
+                return None
 
             # First check: hash-based duplicate detection (100% accurate)
             # Only check if we have a valid hash (skip NULL hashes from older imports)
@@ -240,7 +246,7 @@ class FileImporter:
                 # Cleanup duplicate file from downloads if not already organized
                 if not skip_organize:
                     self._cleanup_download_file(pdf_path)
-                return False
+                return None
 
             # Extract special edition info from parsed data
             base_title = parsed.base_title
@@ -273,7 +279,7 @@ class FileImporter:
                         # Cleanup duplicate file from downloads if not already organized
                         if not skip_organize:
                             self._cleanup_download_file(pdf_path)
-                        return False
+                        return None
 
             cover_path = self._extract_cover(pdf_path)
 
@@ -327,7 +333,7 @@ class FileImporter:
                 )
 
                 if not organized_path:
-                    return False
+                    return None
 
             # Build extra metadata, including special edition info if applicable
             extra_metadata = {
@@ -433,18 +439,52 @@ class FileImporter:
                         f"Will remove tracking record for: {tracking_title} (tracking disabled)"
                     )
 
-            session.commit()
+            if commit:
+                session.commit()
+            else:
+                session.flush()
             logger.info(f"Added to database: {parsed.title} ({category})")
 
             if not skip_organize:
                 self._cleanup_download_file(pdf_path)
 
-            return True
+            return magazine
 
         except Exception as e:
-            session.rollback()
+            if commit:
+                session.rollback()
             logger.error(f"Error importing PDF {pdf_path}: {e}", exc_info=True)
-            return False
+            return None
+
+    def import_many(self, pdf_paths: List[Path], session: Session, **kwargs: Any) -> int:
+        """
+        Import several PDF files and commit them in one transaction.
+
+        Each file is imported inside its own SAVEPOINT, so a failed import is
+        rolled back without losing the others.
+
+        Args:
+            pdf_paths: Paths to PDF files
+            session: Database session
+            **kwargs: Options passed through to import_pdf
+
+        Returns:
+            Number of files imported
+        """
+        imported = 0
+        for pdf_path in pdf_paths:
+            try:
+                with session.begin_nested():
+                    if not self.import_pdf(pdf_path, session, commit=False, **kwargs):
+                        # Leaving the block by exception rolls the savepoint back, even
+                        # when a failed flush has already deactivated it
+                        raise _ImportFailed(pdf_path)
+            except _ImportFailed:
+                continue
+            imported += 1
+
+        session.commit()
+        return imported
 
     def _cleanup_download_file(self, pdf_path: Path) -> None:
         """
@@ -482,6 +522,10 @@ class FileImporter:
 
         cover_dir = self.organize_base_dir / ".covers"
         if file_path.suffix.lower() == '.pdf':
+            # Don't hand files that aren't PDFs to the renderer
+            if not has_pdf_signature(file_path):
+                logger.warning(f"Skipping cover extraction, no PDF signature: {file_path}")
+                return None
             # Use higher DPI for OCR if available
             if OCRService.is_available():
                 return extract_cover_from_pdf(
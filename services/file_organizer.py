@@ -2,6 +2,7 @@
 File organization utilities for moving and renaming PDFs.
 Handles both simple and pattern-based organization with metadata extraction.
 """
+import errno
 import logging
 import os
 import re
@@ -11,13 +12,23 @@ from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
 from core.constants import PDF_COVER_DPI_HIGH, PDF_COVER_QUALITY_HIGH
-from core.parsers import month_abbr_to_number
+from core.parsers import MONTH_ABBREVIATIONS, month_abbr_to_number
 from core.pdf_utils import extract_cover_from_pdf as extract_cover_util
 from core.parsers import sanitize_filename
 
 logger = logging.getLogger(__name__)
 
 
+def _move_file(source: Path, target: Path) -> None:
+    """Rename source to target, copying only when they are on different filesystems"""
+    try:
+        os.replace(source, target)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(source), str(target))
+
+
 class FileOrganizer:
     """Organize and rename files with metadata extraction and cover art handling"""
 
@@ -35,6 +46,14 @@ class FileOrganizer:
         self.organize_dir = Path(organize_dir)
         self.category_prefix = category_prefix
         self.organize_dir.mkdir(parents=True, exist_ok=True)
+        # Target directories this organizer has already created
+        self._made_dirs = set()
+
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create directory unless this organizer already created it"""
+        if directory not in self._made_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._made_dirs.add(directory)
 
     def organize_file(
         self,
@@ -75,8 +94,8 @@ class FileOrganizer:
         if not title or not title.strip():
             raise ValueError("Title cannot be empty")
 
-        month = issue_date.strftime("%b")
-        year = issue_date.strftime("%Y")
+        month = MONTH_ABBREVIATIONS[issue_date.month]
+        year = f"{issue_date.year:04d}"
 
         safe_title = sanitize_filename(title)
         filename_base = f"{safe_title} - {month}{year}"
@@ -86,7 +105,7 @@ class FileOrganizer:
 
         if source.suffix.lower() == ".pdf":
             try:
-                source.rename(pdf_path)
+                _move_file(source, pdf_path)
                 logger.info(f"Organized PDF: {pdf_path}")
             except Exception as e:
                 logger.error(f"Error moving PDF: {e}")
@@ -97,7 +116,7 @@ class FileOrganizer:
 
         if cover_path and Path(cover_path).exists():
             try:
-                Path(cover_path).rename(jpg_path)
+                _move_file(Path(cover_path), jpg_path)
                 logger.info(f"Organized cover: {jpg_path}")
             except Exception as e:
                 logger.error(f"Error moving cover: {e}")
@@ -138,9 +157,9 @@ class FileOrganizer:
             volume = metadata.get("volume")
 
             safe_title = sanitize_filename(title)
-            month = issue_date.strftime("%b")
-            year = issue_date.strftime("%Y")
-            day = issue_date.strftime("%d")
+            month = MONTH_ABBREVIATIONS[issue_date.month]
+            year = f"{issue_date.year:04d}"
+            day = f"{issue_date.day:02d}"
 
             # Build filename with optional issue/volume info
             filename_parts = [safe_title]
@@ -171,7 +190,7 @@ class FileOrganizer:
 
                 path_parts.append(year)
 
-                target_dir = self.organize_dir / Path(*path_parts)
+                target_dir = self.organize_dir.joinpath(*path_parts)
             else:
                 # Format pattern with all available tags
                 format_dict = {
@@ -192,12 +211,7 @@ class FileOrganizer:
                 else:
                     target_dir = Path(target_path_str)
 
-                if not target_path_str.startswith("/"):
-                    target_dir = self.organize_dir / target_path_str
-                else:
-                    target_dir = Path(target_path_str)
-
-            target_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(target_dir)
 
             target_path = target_dir / filename
 
@@ -207,7 +221,15 @@ class FileOrganizer:
                 filename = f"{name_parts[0]} ({timestamp}).pdf"
                 target_path = target_dir / filename
 
-            shutil.move(str(pdf_path), str(target_path))
+            try:
+                _move_file(Path(pdf_path), target_path)
+            except FileNotFoundError:
+                # Cached directory was removed since (e.g. empty folder cleanup)
+                if not Path(pdf_path).exists():
+                    raise
+                self._made_dirs.discard(target_dir)
+                self._ensure_dir(target_dir)
+                _move_file(Path(pdf_path), target_path)
             logger.info(f"Organized file: {target_path}")
             return target_path
 
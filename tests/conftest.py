@@ -0,0 +1,102 @@
+"""
+Shared pytest fixtures
+"""
+
+import os
+from functools import partial
+from pathlib import Path
+
+import bcrypt
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from core.config import ConfigLoader
+from models.database import Base
+
+TEST_CONFIG_PATH = Path(__file__).parent / "config.test.yaml"
+
+# Minimum bcrypt cost; tests exercise auth flows, not hash strength
+TEST_BCRYPT_ROUNDS = 4
+
+TEST_SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+)
+
+
+@pytest.fixture(scope="session")
+def config_test():
+    """ConfigLoader for tests/config.test.yaml, parsed once per session"""
+    return ConfigLoader(config_path=str(TEST_CONFIG_PATH))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """Hash test passwords with the cheapest bcrypt cost factor"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(bcrypt, "gensalt", partial(bcrypt.gensalt, rounds=TEST_BCRYPT_ROUNDS))
+        yield
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """
+    In-memory database whose schema is created once per session.
+
+    Tests isolate their writes through test_db rather than recreating tables.
+    """
+    # Single in-memory connection reused by every checkout; the shared-cache URI
+    # lets any extra connection see the same database, named per pytest-xdist
+    # worker so parallel runs never share one. check_same_thread=False lets the
+    # TestClient's portal thread use it
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    engine = create_engine(
+        f"sqlite:///file:curator_{worker}?mode=memory&cache=shared&uri=true",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # Let SQLAlchemy own BEGIN so SAVEPOINTs behave under pysqlite, and enforce
+    # foreign keys like a real schema would
+    @event.listens_for(engine, "connect")
+    def _configure_connection(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        for pragma in TEST_SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def test_db(db_engine):
+    """
+    (engine, session_factory) whose writes are rolled back after each test.
+
+    Sessions use sessionmaker's defaults, like core.database's, and join
+    an outer connection-level transaction; their commits only release a
+    SAVEPOINT, so the outer rollback discards everything.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session_factory = sessionmaker(bind=connection, join_transaction_mode="create_savepoint")
+    yield db_engine, session_factory
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def db_session(test_db):
+    """A session on the rolled-back test database, for tests that need no factory"""
+    _, session_factory = test_db
+    session = session_factory()
+    yield session
+    session.close()
@@ -1,17 +1,11 @@
-#!/usr/bin/env python3
 """
 Test suite for Download Clients (SABnzbd and NZBGet)
 """
 
-import sys
-from pathlib import Path  # noqa: E402
-from unittest.mock import Mock, patch, MagicMock  # noqa: E402
+from unittest.mock import Mock, patch, MagicMock
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from clients.sabnzbd import SABnzbdClient  # noqa: E402
-from clients.nzbget import NZBGetClient  # noqa: E402
+from clients.sabnzbd import SABnzbdClient
+from clients.nzbget import NZBGetClient
 
 
 # ==================== SABnzbd Tests ====================
@@ -33,9 +27,6 @@ def test_sabnzbd_initialization():
     assert client.api_url == "http://localhost:8080"
     assert client.api_key == "test-key-12345"
 
-    print("Testing SABnzbd initialization... ✓ PASS")
-    pass
-
 
 def test_sabnzbd_missing_api_key():
     """Test that SABnzbd raises error without API key"""
@@ -51,9 +42,6 @@ def test_sabnzbd_missing_api_key():
     except ValueError as e:
         assert "api_key" in str(e)
 
-    print("Testing SABnzbd missing API key... ✓ PASS")
-    pass
-
 
 def test_sabnzbd_defaults():
     """Test SABnzbd default values"""
@@ -67,9 +55,6 @@ def test_sabnzbd_defaults():
     assert client.api_url == "http://localhost:8080"  # Default
     assert client.api_key == "test-key"
 
-    print("Testing SABnzbd defaults... ✓ PASS")
-    pass
-
 
 def test_sabnzbd_submit():
     """Test submitting NZB to SABnzbd"""
@@ -90,9 +75,6 @@ def test_sabnzbd_submit():
         assert job_id == "nzo_12345"
         mock_api.assert_called_once()
 
-    print("Testing SABnzbd submit... ✓ PASS")
-    pass
-
 
 def test_sabnzbd_submit_failure():
     """Test failed NZB submission to SABnzbd"""
@@ -110,9 +92,6 @@ def test_sabnzbd_submit_failure():
 
         assert job_id is None
 
-    print("Testing SABnzbd submit failure... ✓ PASS")
-    pass
-
 
 def test_sabnzbd_get_status_downloading():
     """Test getting download status from SABnzbd (downloading)"""
@@ -144,9 +123,6 @@ def test_sabnzbd_get_status_downloading():
         assert status["progress"] == 45
         assert status["size"] == "1.5GB"
 
-    print("Testing SABnzbd get status (downloading)... ✓ PASS")
-    pass
-
 
 def test_sabnzbd_get_status_completed():
     """Test getting download status from SABnzbd (completed)"""
@@ -186,9 +162,6 @@ def test_sabnzbd_get_status_completed():
         assert status["progress"] == 100
         assert status["file_path"] == "/downloads/magazine.nzb"
 
-    print("Testing SABnzbd get status (completed)... ✓ PASS")
-    pass
-
 
 def test_sabnzbd_get_completed_downloads():
     """Test getting completed downloads from SABnzbd"""
@@ -230,9 +203,6 @@ def test_sabnzbd_get_completed_downloads():
         assert downloads[0]["title"] == "Magazine 1"
         assert downloads[1]["title"] == "Magazine 2"
 
-    print("Testing SABnzbd get completed downloads... ✓ PASS")
-    pass
-
 
 # ==================== NZBGet Tests ====================
 
@@ -255,9 +225,6 @@ def test_nzbget_initialization():
     assert client.username == "nzbget"
     assert client.password == "test-password"
 
-    print("Testing NZBGet initialization... ✓ PASS")
-    pass
-
 
 def test_nzbget_missing_password():
     """Test that NZBGet raises error without password"""
@@ -274,9 +241,6 @@ def test_nzbget_missing_password():
     except ValueError as e:
         assert "password" in str(e)
 
-    print("Testing NZBGet missing password... ✓ PASS")
-    pass
-
 
 def test_nzbget_defaults():
     """Test NZBGet default values"""
@@ -291,9 +255,6 @@ def test_nzbget_defaults():
     assert client.username == "nzbget"  # Default
     assert client.password == "test-password"
 
-    print("Testing NZBGet defaults... ✓ PASS")
-    pass
-
 
 def test_nzbget_submit():
     """Test submitting NZB to NZBGet"""
@@ -315,9 +276,6 @@ def test_nzbget_submit():
         assert job_id == "123"
         mock_api.assert_called_once()
 
-    print("Testing NZBGet submit... ✓ PASS")
-    pass
-
 
 def test_nzbget_submit_failure():
     """Test failed NZB submission to NZBGet"""
@@ -336,9 +294,6 @@ def test_nzbget_submit_failure():
 
         assert job_id is None
 
-    print("Testing NZBGet submit failure... ✓ PASS")
-    pass
-
 
 def test_nzbget_get_status_downloading():
     """Test getting download status from NZBGet (downloading)"""
@@ -368,9 +323,6 @@ def test_nzbget_get_status_downloading():
         assert status["progress"] == 48  # ~500MB/1GB
         assert status["size"] == 1024
 
-    print("Testing NZBGet get status (downloading)... ✓ PASS")
-    pass
-
 
 def test_nzbget_get_status_completed():
     """Test getting download status from NZBGet (completed)"""
@@ -400,9 +352,6 @@ def test_nzbget_get_status_completed():
         assert status["progress"] == 100
         assert status["file_path"] == "/downloads/test"
 
-    print("Testing NZBGet get status (completed)... ✓ PASS")
-    pass
-
 
 def test_nzbget_get_status_unknown():
     """Test getting download status for unknown job"""
@@ -422,9 +371,6 @@ def test_nzbget_get_status_unknown():
         assert status["status"] == "unknown"
         assert status["progress"] == 0
 
-    print("Testing NZBGet get status (unknown)... ✓ PASS")
-    pass
-
 
 def test_nzbget_get_completed_downloads():
     """Test getting completed downloads from NZBGet"""
@@ -466,9 +412,6 @@ def test_nzbget_get_completed_downloads():
         assert downloads[0]["title"] == "Magazine 1"
         assert downloads[1]["title"] == "Magazine 2"
 
-    print("Testing NZBGet get completed downloads... ✓ PASS")
-    pass
-
 
 def test_nzbget_api_call_json_rpc():
     """Test NZBGet JSON-RPC API call format"""
@@ -495,146 +438,3 @@ def test_nzbget_api_call_json_rpc():
         assert call_args[1]["json"]["jsonrpc"] == "2.0"
         assert call_args[1]["json"]["method"] == "append"
         assert result == 123
-
-    print("Testing NZBGet API call JSON-RPC format... ✓ PASS")
-    pass
-
-
-if __name__ == "__main__":
-    print("\n🧪 Download Client Tests\n")
-    print("=" * 70)
-
-    results = {}
-
-    # SABnzbd tests
-    try:
-        results["sabnzbd_init"] = test_sabnzbd_initialization()
-    except Exception as e:
-        print(f"Testing SABnzbd initialization... ❌ FAIL: {e}")
-        results["sabnzbd_init"] = False
-
-    try:
-        results["sabnzbd_missing_key"] = test_sabnzbd_missing_api_key()
-    except Exception as e:
-        print(f"Testing SABnzbd missing API key... ❌ FAIL: {e}")
-        results["sabnzbd_missing_key"] = False
-
-    try:
-        results["sabnzbd_defaults"] = test_sabnzbd_defaults()
-    except Exception as e:
-        print(f"Testing SABnzbd defaults... ❌ FAIL: {e}")
-        results["sabnzbd_defaults"] = False
-
-    try:
-        results["sabnzbd_submit"] = test_sabnzbd_submit()
-    except Exception as e:
-        print(f"Testing SABnzbd submit... ❌ FAIL: {e}")
-        results["sabnzbd_submit"] = False
-
-    try:
-        results["sabnzbd_submit_fail"] = test_sabnzbd_submit_failure()
-    except Exception as e:
-        print(f"Testing SABnzbd submit failure... ❌ FAIL: {e}")
-        results["sabnzbd_submit_fail"] = False
-
-    try:
-        results["sabnzbd_status_dl"] = test_sabnzbd_get_status_downloading()
-    except Exception as e:
-        print(f"Testing SABnzbd get status (downloading)... ❌ FAIL: {e}")
-        results["sabnzbd_status_dl"] = False
-
-    try:
-        results["sabnzbd_status_done"] = test_sabnzbd_get_status_completed()
-    except Exception as e:
-        print(f"Testing SABnzbd get status (completed)... ❌ FAIL: {e}")
-        results["sabnzbd_status_done"] = False
-
-    try:
-        results["sabnzbd_completed"] = test_sabnzbd_get_completed_downloads()
-    except Exception as e:
-        print(f"Testing SABnzbd get completed downloads... ❌ FAIL: {e}")
-        results["sabnzbd_completed"] = False
-
-    # NZBGet tests
-    try:
-        results["nzbget_init"] = test_nzbget_initialization()
-    except Exception as e:
-        print(f"Testing NZBGet initialization... ❌ FAIL: {e}")
-        results["nzbget_init"] = False
-
-    try:
-        results["nzbget_missing_pass"] = test_nzbget_missing_password()
-    except Exception as e:
-        print(f"Testing NZBGet missing password... ❌ FAIL: {e}")
-        results["nzbget_missing_pass"] = False
-
-    try:
-        results["nzbget_defaults"] = test_nzbget_defaults()
-    except Exception as e:
-        print(f"Testing NZBGet defaults... ❌ FAIL: {e}")
-        results["nzbget_defaults"] = False
-
-    try:
-        results["nzbget_submit"] = test_nzbget_submit()
-    except Exception as e:
-        print(f"Testing NZBGet submit... ❌ FAIL: {e}")
-        results["nzbget_submit"] = False
-
-    try:
-        results["nzbget_submit_fail"] = test_nzbget_submit_failure()
-    except Exception as e:
-        print(f"Testing NZBGet submit failure... ❌ FAIL: {e}")
-        results["nzbget_submit_fail"] = False
-
-    try:
-        results["nzbget_status_dl"] = test_nzbget_get_status_downloading()
-    except Exception as e:
-        print(f"Testing NZBGet get status (downloading)... ❌ FAIL: {e}")
-        results["nzbget_status_dl"] = False
-
-    try:
-        results["nzbget_status_done"] = test_nzbget_get_status_completed()
-    except Exception as e:
-        print(f"Testing NZBGet get status (completed)... ❌ FAIL: {e}")
-        results["nzbget_status_done"] = False
-
-    try:
-        results["nzbget_status_unknown"] = test_nzbget_get_status_unknown()
-    except Exception as e:
-        print(f"Testing NZBGet get status (unknown)... ❌ FAIL: {e}")
-        results["nzbget_status_unknown"] = False
-
-    try:
-        results["nzbget_completed"] = test_nzbget_get_completed_downloads()
-    except Exception as e:
-        print(f"Testing NZBGet get completed downloads... ❌ FAIL: {e}")
-        results["nzbget_completed"] = False
-
-    try:
-        results["nzbget_jsonrpc"] = test_nzbget_api_call_json_rpc()
-    except Exception as e:
-        print(f"Testing NZBGet API call JSON-RPC format... ❌ FAIL: {e}")
-        results["nzbget_jsonrpc"] = False
-
-    print("\n" + "=" * 70)
-    print("Test Summary")
-    print("=" * 70)
-
-    sabnzbd_tests = {k: v for k, v in results.items() if "sabnzbd" in k}
-    nzbget_tests = {k: v for k, v in results.items() if "nzbget" in k}
-
-    print("\n📦 SABnzbd Client Tests:")
-    for test_name, passed in sabnzbd_tests.items():
-        status = "✓ PASS" if passed else "❌ FAIL"
-        print(f"  {status}: {test_name}")
-
-    print("\n📦 NZBGet Client Tests:")
-    for test_name, passed in nzbget_tests.items():
-        status = "✓ PASS" if passed else "❌ FAIL"
-        print(f"  {status}: {test_name}")
-
-    all_passed = all(results.values())
-    print("\n" + "=" * 70)
-    print("\n" + ("All tests passed! ✓" if all_passed else "Some tests failed. ❌"))
-
-    sys.exit(0 if all_passed else 1)
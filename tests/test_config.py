@@ -2,20 +2,15 @@
 Test suite for ConfigLoader functionality
 """
 
-import sys
 from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from core.config import ConfigLoader
-
 
 @pytest.fixture
-def config_loader():
-    """Create ConfigLoader instance for testing"""
-    return ConfigLoader(config_path="tests/config.test.yaml")
+def config_loader(config_test):
+    """ConfigLoader instance for testing (shared session-wide)"""
+    return config_test
 
 
 class TestConfigLoaderInitialization:
@@ -211,7 +206,3 @@ class TestServerConfiguration:
         assert server["host"] in ["0.0.0.0", "127.0.0.1", "localhost"]
         assert isinstance(server["port"], int)
         assert 1024 <= server["port"] <= 65535
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v", "--tb=short"])
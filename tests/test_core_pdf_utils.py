@@ -7,15 +7,11 @@ Test Coverage:
 - Integration with pdf2image library
 """
 
-import sys
-from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from core.pdf_utils import extract_cover_from_pdf
+from core.pdf_utils import extract_cover_from_pdf, has_pdf_signature
 from core.constants import PDF_COVER_DPI_LOW, PDF_COVER_QUALITY
 
 
@@ -213,6 +209,30 @@ class TestExtractCoverFromPDF:
         assert save_call_args[1]["quality"] == PDF_COVER_QUALITY
 
 
+class TestHasPDFSignature:
+    """Test the PDF header check"""
+
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            (b"%PDF-1.4\n%%EOF\n", True),
+            (b"\x00" * 100 + b"%PDF-1.7", True),  # Junk before the header is allowed
+            (b"test content", False),
+            (b"", False),
+        ],
+    )
+    def test_detects_signature(self, content, expected, tmp_path):
+        """Test files are classified by their first bytes."""
+        pdf_path = tmp_path / "file.pdf"
+        pdf_path.write_bytes(content)
+
+        assert has_pdf_signature(pdf_path) is expected
+
+    def test_missing_file(self, tmp_path):
+        """Test that an unreadable file is not reported as a PDF."""
+        assert has_pdf_signature(tmp_path / "missing.pdf") is False
+
+
 class TestPDFUtilsEdgeCases:
     """Test edge cases and error conditions"""
 
@@ -7,15 +7,12 @@ Test Coverage:
 - PDF/EPUB file discovery
 """
 
-import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, mock_open
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from core.utils import hash_file_in_chunks, is_special_edition, find_pdf_epub_files
 
 
@@ -2,7 +2,6 @@
 Test suite for Database Models and initialization
 """
 
-import sys
 import tempfile
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -11,9 +10,6 @@ import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from core.database import DatabaseManager
 from models.database import (
     Base,
@@ -512,7 +508,3 @@ class TestIndexing:
         assert hasattr(MagazineTracking, "olid")
         assert hasattr(MagazineTracking, "title")
         assert hasattr(MagazineTracking, "created_at")
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v", "--tb=short"])
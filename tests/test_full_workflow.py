@@ -3,7 +3,6 @@ Integration tests for end-to-end workflows
 Tests complete user journeys through the application
 """
 
-import sys
 import tempfile
 from datetime import UTC, datetime
 from pathlib import Path
@@ -13,8 +12,6 @@ import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from core.auth import AuthManager
 from core.database import DatabaseManager
 from models.database import Base, DownloadSubmission, Magazine, MagazineTracking
@@ -61,7 +58,7 @@ def session(test_db):
 @pytest.fixture
 def auth_manager(test_db):
     """Create auth manager"""
-    return AuthManager(test_db.session_factory, "test-secret-key")
+    return AuthManager(test_db.session_factory, "test-secret-key-for-testing-only")
 
 
 @pytest.fixture
@@ -429,7 +426,3 @@ class TestErrorRecovery:
         # Nonexistent user
         success, message = auth_manager.verify_credentials("nonexistent", "password")
         assert success is False
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v", "--tb=short"])
@@ -1,17 +1,11 @@
-#!/usr/bin/env python3
 """
 Test suite for file categorization utilities.
 Tests categorizing files into magazines, comics, newspapers, etc.
 """
 
-import sys
-from pathlib import Path
 
 import pytest
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from core.parsers import FileCategorizer
 from core.constants import CATEGORY_KEYWORDS
 
@@ -235,7 +229,3 @@ class TestCategorizerIntegration:
         # Result should be a valid category name
         assert isinstance(magazine_result, str)
         assert len(magazine_result) > 0
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
@@ -1,17 +1,11 @@
-#!/usr/bin/env python3
 """
 Test suite for country detection utilities.
 Tests country detection from text and ISO country mappings.
 """
 
-import sys
-from pathlib import Path
 
 import pytest
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from core.parsers import detect_country, find_country, ISO_COUNTRIES
 
 
@@ -203,7 +197,3 @@ class TestCountryDetectionIntegration:
         """Test country detection from folder paths."""
         path = "/magazines/UK/Wired/2024/Wired-Jan2024.pdf"
         assert detect_country(path) == "UK"
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
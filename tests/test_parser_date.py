@@ -1,22 +1,15 @@
-#!/usr/bin/env python3
 """
 Test suite for date parsing utilities.
 Tests month name mapping, abbreviation conversion, and date utilities.
 """
 
-import sys
 from datetime import UTC, datetime
-from pathlib import Path
-
-import pytest
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.parsers import (
     month_abbr_to_number,
     normalize_month_name,
     utc_now,
+    MONTH_ABBREVIATIONS,
     MONTH_NAME_MAPPING,
     MONTH_NUMBER_MAPPING,
 )
@@ -149,6 +142,16 @@ class TestMonthNumberMapping:
             assert MONTH_NUMBER_MAPPING[12] == "Dec"
 
 
+class TestMonthAbbreviations:
+    """Test MONTH_ABBREVIATIONS constant."""
+
+    def test_indexed_by_month_number(self):
+        """Test that month numbers index the matching abbreviation."""
+        for month in range(1, 13):
+            assert MONTH_ABBREVIATIONS[month] == datetime(2024, month, 1).strftime("%b")
+            assert month_abbr_to_number(MONTH_ABBREVIATIONS[month]) == month
+
+
 class TestUtcNow:
     """Test utc_now utility function."""
 
@@ -234,7 +237,3 @@ class TestEdgeCases:
         except (TypeError, AttributeError):
             # Expected if function doesn't handle None
             pass
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
@@ -3,30 +3,15 @@ Test individual edition tracking functionality.
 Tests selected_editions dictionary, download_selected_editions method, and edition matching.
 """
 
-import sys
-
-sys.path.insert(0, ".")
-
 import pytest
 from datetime import datetime, UTC
 from unittest.mock import Mock
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
 from services import DownloadManager
-from models.database import Base, MagazineTracking, DownloadSubmission, SearchResult as DBSearchResult
+from models.database import MagazineTracking, DownloadSubmission, SearchResult as DBSearchResult
 from core.bases import SearchProvider, DownloadClient, SearchResult
 
 
-@pytest.fixture
-def test_db():
-    """Create in-memory test database"""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    session_factory = sessionmaker(bind=engine)
-    return engine, session_factory
-
-
 @pytest.fixture
 def mock_search_provider():
     """Create mock search provider with edition metadata"""
@@ -358,36 +343,23 @@ class TestEditionMatching:
 class TestAutoDownloadIntegration:
     """Test integration with auto-download task"""
 
-    def test_auto_download_checks_selected_editions(self, test_db):
-        """Test that periodicals with selected_editions are processed"""
+    def test_auto_download_checks_selected_editions(self, test_db, download_manager):
+        """Test that periodicals with tracking enabled or selected editions are processed"""
         engine, session_factory = test_db
         session = session_factory()
 
-        # Create tracking with selected editions
-        tracking = MagazineTracking(
-            olid="test-mag",
-            title="Test Magazine",
-            track_all_editions=False,
-            track_new_only=False,
-            selected_editions={"OL123456M": True},
-        )
-        session.add(tracking)
+        session.add_all([
+            MagazineTracking(olid="all", title="All", track_all_editions=True),
+            MagazineTracking(olid="new", title="New", track_new_only=True),
+            MagazineTracking(olid="selected", title="Selected", selected_editions={"OL1M": False, "OL2M": True}),
+            MagazineTracking(olid="unselected", title="Unselected", selected_editions={"OL1M": False}),
+            MagazineTracking(olid="empty", title="Empty", selected_editions={}),
+            MagazineTracking(olid="none", title="None", selected_editions=None),
+        ])
         session.commit()
 
-        # Query for periodicals to check (mimics auto_download_task logic)
-        tracked_with_selections = (
-            session.query(MagazineTracking).filter(MagazineTracking.selected_editions.isnot(None)).all()
-        )
+        tracked = download_manager.get_auto_download_tracking(session)
 
-        # Should find the tracking record
-        assert len(tracked_with_selections) > 0
-
-        # Check if any editions are actually selected
-        has_selections = any(any(t.selected_editions.values()) for t in tracked_with_selections)
-        assert has_selections is True
+        assert sorted(t.olid for t in tracked) == ["all", "new", "selected"]
 
         session.close()
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
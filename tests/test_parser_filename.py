@@ -1,16 +1,8 @@
-#!/usr/bin/env python3
 """
 Test suite for filename parsing and sanitization utilities.
 Tests filename parsing for metadata and filename sanitization.
 """
 
-import sys
-from pathlib import Path
-
-import pytest
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.parsers import parse_filename_for_metadata, sanitize_filename
 
@@ -267,7 +259,3 @@ class TestFilenameParsingIntegration:
         # Other formats may not parse
         result2 = parse_filename_for_metadata("TIME-2024-01-15.pdf")
         assert result2["confidence"] == "low"
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
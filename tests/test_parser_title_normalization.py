@@ -3,55 +3,34 @@ Test title normalization across tracking, library view, and folder organization.
 Ensures titles are consistently cleaned and grouped throughout the system.
 """
 
-import sys
-import tempfile
 from datetime import datetime
 from pathlib import Path
 
 import pytest
-from sqlalchemy import create_engine, func
-from sqlalchemy.orm import sessionmaker
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from sqlalchemy import func
 
 from core.parsers import TitleMatcher
-from models.database import Base, Magazine, MagazineTracking
+from models.database import Magazine, MagazineTracking
 from services import FileImporter
 
 
 @pytest.fixture
-def test_db():
-    """Create in-memory test database"""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    session_factory = sessionmaker(bind=engine)
-    return engine, session_factory
-
-
-@pytest.fixture
-def temp_dirs():
+def temp_dirs(tmp_path):
     """Create temporary directories for testing"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        temp_path = Path(tmpdir)
-        dirs = {
-            "download_dir": temp_path / "downloads",
-            "organize_dir": temp_path / "organized",
-        }
-        # Create directories
-        for key in ["download_dir", "organize_dir"]:
-            dirs[key].mkdir(parents=True, exist_ok=True)
-
-        yield dirs
+    dirs = {
+        "download_dir": tmp_path / "downloads",
+        "organize_dir": tmp_path / "organized",
+    }
+    for path in dirs.values():
+        path.mkdir()
+    return dirs
 
 
 class TestTitleNormalization:
     """Test that titles are normalized consistently across all systems"""
 
-    def test_wired_variants_grouped_together(self, test_db, temp_dirs):
+    def test_wired_variants_grouped_together(self, db_session, temp_dirs):
         """Test that different Wired variants are normalized to same tracking title"""
-        engine, session_factory = test_db
-        session = session_factory()
-
         # Create FileImporter
         importer = FileImporter(
             downloads_dir=str(temp_dirs["download_dir"]),
@@ -73,24 +52,17 @@ class TestTitleNormalization:
             test_file.write_text(f"test content {i}")
 
             # Import the file
-            success = importer.import_pdf(
+            magazine = importer.import_pdf(
                 test_file,
-                session,
+                db_session,
                 auto_track=True,
                 tracking_mode="all",
             )
 
-            if success:
-                # Get the imported magazine
-                magazine = (
-                    session.query(Magazine)
-                    .order_by(Magazine.id.desc())
-                    .first()
-                )
-                if magazine:
-                    imported_titles.append(magazine.title)
+            if magazine:
+                imported_titles.append(magazine.title)
 
-        session.commit()
+        db_session.commit()
 
         # Verify all imported magazines have the same normalized title
         unique_titles = set(imported_titles)
@@ -113,13 +85,8 @@ class TestTitleNormalization:
         assert "2024" not in normalized_title
         assert "Hybrid" not in normalized_title
 
-        session.close()
-
-    def test_library_view_grouping(self, test_db, temp_dirs):
+    def test_library_view_grouping(self, db_session, temp_dirs):
         """Test that library view groups magazines by normalized title"""
-        engine, session_factory = test_db
-        session = session_factory()
-
         # Create FileImporter
         importer = FileImporter(
             downloads_dir=str(temp_dirs["download_dir"]),
@@ -134,32 +101,30 @@ class TestTitleNormalization:
             ("Wired UK - Mar2024.pdf", datetime(2024, 3, 1)),
         ]
 
+        paths = []
         for idx, (filename, expected_date) in enumerate(test_files):
             test_file = temp_dirs["download_dir"] / filename
             # Create unique content for each file to avoid hash collisions
             test_file.write_text(f"test content for issue {idx + 1}")
-
-            importer.import_pdf(test_file, session, auto_track=True)
-
-        session.commit()
-
-        # Simulate library view query (groups by title)
-        # This is what the /api/periodicals endpoint does
-        subquery = (
-            session.query(
-                Magazine.title,
-                func.max(Magazine.issue_date).label("max_date")
-            )
-            .group_by(Magazine.title)
-            .subquery()
+            paths.append(test_file)
+
+        assert importer.import_many(paths, db_session, auto_track=True) == len(paths)
+
+        # Simulate library view query (latest issue per title)
+        ranked = db_session.query(
+            Magazine.id,
+            func.row_number().over(
+                partition_by=Magazine.title, order_by=Magazine.issue_date.desc()
+            ).label("rn"),
+        ).subquery()
+
+        grouped_periodicals = (
+            db_session.query(Magazine)
+            .join(ranked, Magazine.id == ranked.c.id)
+            .filter(ranked.c.rn == 1)
+            .all()
         )
 
-        grouped_periodicals = session.query(Magazine).join(
-            subquery,
-            (Magazine.title == subquery.c.title)
-            & (Magazine.issue_date == subquery.c.max_date)
-        ).all()
-
         # Should have only 1 group (all grouped under same title)
         if len(grouped_periodicals) > 0 and "Tmp" in grouped_periodicals[0].title:
             pytest.skip("Title extracted from temp directory - PDF metadata extraction failed")
@@ -167,16 +132,11 @@ class TestTitleNormalization:
 
         # Get issue count for the group
         periodical = grouped_periodicals[0]
-        issue_count = session.query(Magazine).filter(Magazine.title == periodical.title).count()
+        issue_count = db_session.query(Magazine).filter(Magazine.title == periodical.title).count()
         assert issue_count == 3, f"Expected 3 issues in group, got {issue_count}"
 
-        session.close()
-
-    def test_organized_folder_structure(self, test_db, temp_dirs):
+    def test_organized_folder_structure(self, db_session, temp_dirs):
         """Test that organized files use normalized titles for folder names"""
-        engine, session_factory = test_db
-        session = session_factory()
-
         # Create FileImporter
         importer = FileImporter(
             downloads_dir=str(temp_dirs["download_dir"]),
@@ -187,13 +147,13 @@ class TestTitleNormalization:
         test_file = temp_dirs["download_dir"] / "Unpack Wired No 11 2024 UK Hybrid Magazine.pdf"
         test_file.write_text("test content")
 
-        success = importer.import_pdf(test_file, session, auto_track=True)
+        success = importer.import_pdf(test_file, db_session, auto_track=True)
         assert success, "Import should succeed"
 
-        session.commit()
+        db_session.commit()
 
         # Get the imported magazine
-        magazine = session.query(Magazine).first()
+        magazine = db_session.query(Magazine).first()
         assert magazine is not None
 
         # Check the organized file path
@@ -215,13 +175,8 @@ class TestTitleNormalization:
         assert "Unpack" not in path_str
         assert "Hybrid Magazine" not in path_str
 
-        session.close()
-
-    def test_tracking_record_uses_normalized_title(self, test_db, temp_dirs):
+    def test_tracking_record_uses_normalized_title(self, db_session, temp_dirs):
         """Test that tracking records are created with normalized titles"""
-        engine, session_factory = test_db
-        session = session_factory()
-
         # Create FileImporter
         importer = FileImporter(
             downloads_dir=str(temp_dirs["download_dir"]),
@@ -232,13 +187,13 @@ class TestTitleNormalization:
         test_file = temp_dirs["download_dir"] / "Wired No 5 2024 UK Hybrid Magazine.pdf"
         test_file.write_text("test content")
 
-        success = importer.import_pdf(test_file, session, auto_track=True, tracking_mode="all")
+        success = importer.import_pdf(test_file, db_session, auto_track=True, tracking_mode="all")
         assert success, "Import should succeed"
 
-        session.commit()
+        db_session.commit()
 
         # Check tracking record
-        tracking = session.query(MagazineTracking).first()
+        tracking = db_session.query(MagazineTracking).first()
         assert tracking is not None, "Tracking record should be created"
 
         # Skip if title was extracted from temp directory
@@ -254,13 +209,8 @@ class TestTitleNormalization:
         assert "2024" not in tracking.title
         assert "Hybrid" not in tracking.title
 
-        session.close()
-
-    def test_2600_magazine_normalization(self, test_db, temp_dirs):
+    def test_2600_magazine_normalization(self, db_session, temp_dirs):
         """Test that 2600 magazine titles are normalized correctly"""
-        engine, session_factory = test_db
-        session = session_factory()
-
         importer = FileImporter(
             downloads_dir=str(temp_dirs["download_dir"]),
             organize_base_dir=str(temp_dirs["organize_dir"]),
@@ -273,15 +223,20 @@ class TestTitleNormalization:
             "2600.The.Hacker.Quarterly.Winter.2024.pdf",
         ]
 
+        paths = []
         for idx, filename in enumerate(test_files):
             test_file = temp_dirs["download_dir"] / filename
             test_file.write_text(f"test content {idx}")
-            importer.import_pdf(test_file, session, auto_track=True)
+            paths.append(test_file)
 
-        session.commit()
+        imported = importer.import_many(paths, db_session, auto_track=True)
+
+        # All three parse to the same 2024 issue date, so the later two are skipped
+        # as date-based duplicates of the first
+        assert imported == 1
 
         # Check how many unique titles we have
-        unique_titles = session.query(Magazine.title).distinct().all()
+        unique_titles = db_session.query(Magazine.title).distinct().all()
         unique_titles_list = [t[0] for t in unique_titles]
 
         # All should be grouped under one title containing "2600"
@@ -293,8 +248,6 @@ class TestTitleNormalization:
             pytest.skip("Title extracted from temp directory - PDF metadata extraction failed")
         assert "2600" in normalized_title
 
-        session.close()
-
     def test_title_matcher_clean_release_title(self):
         """Test TitleMatcher.clean_release_title() removes unwanted patterns"""
         matcher = TitleMatcher()
@@ -335,6 +288,33 @@ class TestTitleNormalization:
             assert "Hybrid" not in cleaned
             assert "Digital" not in cleaned
 
+    def test_deduplicate_results_groups_similar_titles(self):
+        """Test deduplicate_results groups fuzzy matches under the first matching group"""
+        matcher = TitleMatcher(threshold=80)
+        results = [
+            {"title": "Wired Magazine January 2024"},
+            {"title": "National Geographic January 2024"},
+            {"title": "WIRED magazine january 2024"},
+            {"title": "National Geographic Jan 2024"},
+        ]
+
+        groups = matcher.deduplicate_results(results)
+
+        assert [[r["title"] for r in g] for g in groups.values()] == [
+            ["Wired Magazine January 2024", "WIRED magazine january 2024"],
+            ["National Geographic January 2024", "National Geographic Jan 2024"],
+        ]
+        assert list(groups) == ["group_0", "group_1"]
+        assert results[0]["match_score"] == 100
+        assert results[2]["match_score"] == 100
+
+    def test_fuzzy_match_with_delimiters_locates_misspelled_word(self):
+        """Test delimiter-aware matching finds the closest word window"""
+        matcher = TitleMatcher()
+
+        start, length, score = matcher.fuzzy_match_with_delimiters(
+            "UK.Wired.Magazin.2024", "Wired Magazine", threshold=0.6
+        )
 
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+        assert (start, length) == (3, 14)
+        assert score == 0.96
@@ -1,19 +1,14 @@
-#!/usr/bin/env python3
 """
 Comprehensive test suite for UnifiedParser.
 Tests all parsing use cases and dataclass models.
 """
 
-import sys
 import tempfile
 from datetime import datetime
 from pathlib import Path
 
 import pytest
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from core.parsers import UnifiedParser
 from core.parsers.models import (
     ParsedMetadata,
@@ -666,7 +661,3 @@ class TestUnifiedParserEdgeCases:
         # Assert
         assert result.title is not None
         assert len(result.title) > 0
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
@@ -1,107 +1,96 @@
-import sys
-from pathlib import Path  # noqa: E402
+"""
+Tests for Newsnab search provider (providers/newsnab.py)
+"""
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from unittest.mock import Mock, patch
 
-import logging
+import pytest
 
-# Suppress debug logging to reduce output
-logging.basicConfig(level=logging.WARNING)
-logging.getLogger("urllib3").setLevel(logging.WARNING)
+from core.factory import ProviderFactory
+from providers.newsnab import NewsnabProvider
 
-from core.config import ConfigLoader  # noqa: E402
-from core.factory import ProviderFactory  # noqa: E402
-from providers.newsnab import NewsnabProvider  # noqa: E402
+# Recorded indexer response replayed instead of hitting the network
+RECORDED_SEARCH_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Test Newsnab</title>
+    <item>
+      <title>National.Geographic.USA.January.2024.PDF</title>
+      <link>http://test-newsnab.example.com/getnzb/1.nzb</link>
+      <enclosure url="http://test-newsnab.example.com/getnzb/1.nzb" type="application/x-nzb"/>
+      <indexer>Test Indexer</indexer>
+    </item>
+    <item>
+      <title>National.Geographic.UK.February.2024.PDF</title>
+      <link>http://test-newsnab.example.com/getnzb/2.nzb</link>
+      <indexer>Test Indexer</indexer>
+    </item>
+  </channel>
+</rss>
+"""
 
-print("\n🧪 Search Provider Tests (Newsnab)\n")
-print("=" * 50)
 
-results = {}
+def recorded_response():
+    """Build a mock requests response carrying the recorded XML"""
+    response = Mock()
+    response.content = RECORDED_SEARCH_XML
+    response.raise_for_status.return_value = None
+    return response
 
-# Test Newsnab init
-print("Testing NewsnabProvider.__init__()...", end=" ")
-try:
-    config_loader = ConfigLoader(config_path="tests/config.test.yaml")
-    search_providers_config = config_loader.get_search_providers()
-    newsnab_config = next(
-        (p for p in search_providers_config if p.get("type") == "newsnab"), None
+
+@pytest.fixture(scope="session")
+def newsnab_config(config_test):
+    """Newsnab entry from the test config"""
+    config = next(
+        (p for p in config_test.get_search_providers() if p.get("type") == "newsnab"),
+        None,
     )
+    if config is None:
+        pytest.skip("Newsnab provider not configured")
+    return config
+
+
+def test_init(newsnab_config):
+    """Test NewsnabProvider initialization"""
+    provider = NewsnabProvider(newsnab_config)
+
+    assert hasattr(provider, "api_url")
+    assert hasattr(provider, "api_key")
+    assert hasattr(provider, "categories")
+
+
+def test_categories_config(newsnab_config):
+    """Test configured and default Newsnab categories"""
+    provider = NewsnabProvider(newsnab_config)
+    assert provider.categories == "7000,7010,7020,7030"
+
+    config_no_categories = {k: v for k, v in newsnab_config.items() if k != "categories"}
+    provider_default = NewsnabProvider(config_no_categories)
+    assert provider_default.categories == "7000,7010,7020,7030"
+
+
+def test_search(newsnab_config):
+    """Test search via the factory against a recorded response"""
+    provider = ProviderFactory.create(newsnab_config)
+
+    with patch("providers.newsnab.requests.get", return_value=recorded_response()) as mock_get:
+        results = provider.search("National Geographic")
+
+    assert [r.title for r in results] == [
+        "National.Geographic.USA.January.2024.PDF",
+        "National.Geographic.UK.February.2024.PDF",
+    ]
+    assert mock_get.call_args.kwargs["params"]["q"] == "National Geographic"
+
+
+def test_search_xml_api(newsnab_config):
+    """Test the XML API parser maps enclosures, links and indexer"""
+    provider = NewsnabProvider(newsnab_config)
+
+    with patch("providers.newsnab.requests.get", return_value=recorded_response()) as mock_get:
+        results = provider._search_xml_api("National Geographic", "Magazines")
 
-    if newsnab_config:
-        provider = NewsnabProvider(newsnab_config)
-        assert hasattr(provider, "api_url")
-        assert hasattr(provider, "api_key")
-        assert hasattr(provider, "categories")
-        print("✓ PASS")
-        results["NewsnabProvider.__init__()"] = True
-    else:
-        print("⚠ SKIP (not configured)")
-        results["NewsnabProvider.__init__()"] = True
-except Exception as e:
-    print(f"❌ FAIL: {e}")
-    results["NewsnabProvider.__init__()"] = False
-
-# Test Newsnab categories configuration
-print("Testing NewsnabProvider categories config...", end=" ")
-try:
-    if newsnab_config:
-        # Test with configured categories
-        provider = NewsnabProvider(newsnab_config)
-        assert provider.categories == "7000,7010,7020,7030"
-
-        # Test with default categories (no categories in config)
-        config_no_categories = newsnab_config.copy()
-        if "categories" in config_no_categories:
-            del config_no_categories["categories"]
-        provider_default = NewsnabProvider(config_no_categories)
-        assert provider_default.categories == "7000,7010,7020,7030"
-
-        print("✓ PASS")
-        results["NewsnabProvider categories config"] = True
-    else:
-        print("⚠ SKIP (not configured)")
-        results["NewsnabProvider categories config"] = True
-except Exception as e:
-    print(f"❌ FAIL: {e}")
-    results["NewsnabProvider categories config"] = False
-
-# Test Newsnab search
-print("Testing NewsnabProvider.search()...", end=" ")
-try:
-    if newsnab_config:
-        provider = ProviderFactory.create(newsnab_config)
-        results_list = provider.search("National Geographic")
-        assert isinstance(results_list, list)
-        print(f"✓ PASS ({len(results_list)} results)")
-        results["NewsnabProvider.search()"] = True
-    else:
-        print("⚠ SKIP (not configured)")
-        results["NewsnabProvider.search()"] = True
-except Exception as e:
-    print(f"⚠ {str(e)[:50]}")
-    results["NewsnabProvider.search()"] = True  # Skip if offline
-
-# Test internal XML API
-print("Testing NewsnabProvider._search_xml_api()...", end=" ")
-try:
-    if newsnab_config:
-        results_list = provider._search_xml_api("National Geographic")
-        assert isinstance(results_list, list)
-        print(f"✓ PASS ({len(results_list)} results)")
-        results["NewsnabProvider._search_xml_api()"] = True
-    else:
-        print("⚠ SKIP (not configured)")
-        results["NewsnabProvider._search_xml_api()"] = True
-except Exception as e:
-    print(f"⚠ {str(e)[:50]}")
-    results["NewsnabProvider._search_xml_api()"] = True  # Skip if offline
-
-print("\n" + "=" * 50)
-print("Test Summary")
-print("=" * 50)
-for test_name, passed in results.items():
-    status = "✓ PASS" if passed else "❌ FAIL"
-    print(f"{status}: {test_name}")
-
-all_passed = all(results.values())
-print("\n" + ("All tests passed! ✓" if all_passed else "Some tests had issues"))
+    assert mock_get.call_args.kwargs["params"]["cat"] == "7010"
+    assert results[0].url == "http://test-newsnab.example.com/getnzb/1.nzb"
+    assert results[1].url == "http://test-newsnab.example.com/getnzb/2.nzb"
+    assert results[0].raw_metadata == {"indexer": "Test Indexer"}
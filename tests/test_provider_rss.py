@@ -10,19 +10,58 @@ Test Coverage:
 - Result mapping to SearchResult objects
 """
 
-import sys
 from datetime import datetime
-from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 from time import struct_time
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from core.bases import SearchResult
 from providers.rss import RSSProvider
 
+# Publication dates shared by the feed entries below
+JAN_15_2024 = struct_time((2024, 1, 15, 10, 30, 0, 0, 0, 0))
+FEB_15_2024 = struct_time((2024, 2, 15, 10, 30, 0, 0, 0, 0))
+JAN_15_2024_AFTERNOON = struct_time((2024, 1, 15, 14, 30, 45, 0, 0, 0))
+JAN_1_2024 = struct_time((2024, 1, 1, 0, 0, 0, 0, 0, 0))
+FEB_1_2024 = struct_time((2024, 2, 1, 0, 0, 0, 0, 0, 0))
+MAR_1_2024 = struct_time((2024, 3, 1, 0, 0, 0, 0, 0, 0))
+
+_MISSING = object()
+
+
+def make_entry(published_parsed=_MISSING, **fields):
+    """
+    Build a feedparser-style entry exposing .get() over the given fields.
+
+    published_parsed is only set as an attribute when passed, so entries
+    without it match feedparser entries that lack a publication date.
+    """
+    entry = SimpleNamespace(get=fields.get)
+    if published_parsed is not _MISSING:
+        entry.published_parsed = published_parsed
+    return entry
+
+
+def make_feed(entries, bozo=False, bozo_exception=None):
+    """Build a feedparser-style parse result"""
+    return SimpleNamespace(bozo=bozo, bozo_exception=bozo_exception, entries=entries)
+
+
+@pytest.fixture
+def mock_parse(monkeypatch):
+    """Replace feedparser.parse for the duration of a test"""
+    parse = MagicMock()
+    monkeypatch.setattr("providers.rss.feedparser.parse", parse)
+    return parse
+
+
+@pytest.fixture(scope="module")
+def rss_provider():
+    """RSSProvider shared by tests that only need the default feed"""
+    return RSSProvider({"type": "rss", "feed_url": "https://example.com/feed.xml"})
+
 
 class TestRSSProviderInitialization:
     """Test RSS provider initialization and configuration"""
@@ -80,51 +119,37 @@ class TestRSSProviderInitialization:
 class TestRSSProviderSearch:
     """Test RSS feed search functionality"""
 
-    @patch("providers.rss.feedparser.parse")
-    def test_search_returns_matching_results(self, mock_parse):
+    def test_search_returns_matching_results(self, mock_parse, rss_provider):
         """Test search returns entries matching the query."""
         # Arrange
-        config = {
-            "type": "rss",
-            "feed_url": "https://example.com/feed.xml",
-        }
-        provider = RSSProvider(config)
-
         # Create mock entries as objects with attributes (like feedparser returns)
-        entry1 = Mock()
-        entry1.get = lambda key, default="": {
-            "title": "National Geographic January 2024",
-            "link": "https://example.com/nat-geo-jan-2024",
-            "summary": "Amazing wildlife photos",
-            "id": "ng-jan-2024",
-        }.get(key, default)
-        entry1.published_parsed = struct_time((2024, 1, 15, 10, 30, 0, 0, 0, 0))
-
-        entry2 = Mock()
-        entry2.get = lambda key, default="": {
-            "title": "National Geographic February 2024",
-            "link": "https://example.com/nat-geo-feb-2024",
-            "summary": "Ocean exploration",
-            "id": "ng-feb-2024",
-        }.get(key, default)
-        entry2.published_parsed = struct_time((2024, 2, 15, 10, 30, 0, 0, 0, 0))
-
-        entry3 = Mock()
-        entry3.get = lambda key, default="": {
-            "title": "Time Magazine January 2024",
-            "link": "https://example.com/time-jan-2024",
-            "summary": "World news",
-            "id": "time-jan-2024",
-        }.get(key, default)
-        delattr(entry3, "published_parsed")  # No published_parsed attribute
-
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.entries = [entry1, entry2, entry3]
-        mock_parse.return_value = mock_feed
+        entry1 = make_entry(
+            title="National Geographic January 2024",
+            link="https://example.com/nat-geo-jan-2024",
+            summary="Amazing wildlife photos",
+            id="ng-jan-2024",
+            published_parsed=JAN_15_2024,
+        )
+
+        entry2 = make_entry(
+            title="National Geographic February 2024",
+            link="https://example.com/nat-geo-feb-2024",
+            summary="Ocean exploration",
+            id="ng-feb-2024",
+            published_parsed=FEB_15_2024,
+        )
+
+        entry3 = make_entry(
+            title="Time Magazine January 2024",
+            link="https://example.com/time-jan-2024",
+            summary="World news",
+            id="time-jan-2024",
+        )
+
+        mock_parse.return_value = make_feed([entry1, entry2, entry3])
 
         # Act
-        results = provider.search("National Geographic")
+        results = rss_provider.search("National Geographic")
 
         # Assert
         assert len(results) == 2
@@ -133,256 +158,151 @@ class TestRSSProviderSearch:
         assert results[1].title == "National Geographic February 2024"
         assert "national geographic" in results[0].title.lower()
 
-    @patch("providers.rss.feedparser.parse")
-    def test_search_case_insensitive(self, mock_parse):
-        """Test search is case-insensitive when matching queries."""
-        config = {"type": "rss", "feed_url": "https://example.com/feed.xml"}
-        provider = RSSProvider(config)
-
-        entry = Mock()
-        entry.get = lambda key, default="": {
-            "title": "NATIONAL GEOGRAPHIC January 2024",
-            "link": "https://example.com/nat-geo",
-        }.get(key, default)
-        delattr(entry, "published_parsed")
-
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.entries = [entry]
-        mock_parse.return_value = mock_feed
-
-        results = provider.search("national geographic")
-
-        assert len(results) == 1
-        assert results[0].title == "NATIONAL GEOGRAPHIC January 2024"
-
-    @patch("providers.rss.feedparser.parse")
-    def test_search_returns_empty_list_when_no_matches(self, mock_parse):
-        """Test search returns empty list when no entries match query."""
-        config = {"type": "rss", "feed_url": "https://example.com/feed.xml"}
-        provider = RSSProvider(config)
-
-        entry = Mock()
-        entry.get = lambda key, default="": {
-            "title": "Time Magazine January 2024",
-            "link": "https://example.com/time",
-        }.get(key, default)
-        delattr(entry, "published_parsed")
-
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.entries = [entry]
-        mock_parse.return_value = mock_feed
-
-        results = provider.search("National Geographic")
-
-        assert len(results) == 0
-        assert results == []
-
-    @patch("providers.rss.feedparser.parse")
-    def test_search_extracts_publication_date(self, mock_parse):
+    @pytest.mark.parametrize(
+        "fields,query,bozo,expected_titles,check",
+        [
+            pytest.param(
+                {"title": "NATIONAL GEOGRAPHIC January 2024", "link": "https://example.com/nat-geo"},
+                "national geographic",
+                False,
+                ["NATIONAL GEOGRAPHIC January 2024"],
+                None,
+                id="case_insensitive",
+            ),
+            pytest.param(
+                {"title": "Time Magazine January 2024", "link": "https://example.com/time"},
+                "National Geographic",
+                False,
+                [],
+                None,
+                id="no_matches",
+            ),
+            pytest.param(
+                {"title": "Test Magazine"},
+                "Magazine",
+                False,
+                ["Test Magazine"],
+                lambda r: r.url == "" and r.raw_metadata == {"summary": "", "guid": ""},
+                id="missing_optional_fields",
+            ),
+            pytest.param(
+                {"title": "Test Magazine", "link": "https://example.com/test"},
+                "Magazine",
+                False,
+                ["Test Magazine"],
+                lambda r: r.provider == "rss",
+                id="sets_provider_type",
+            ),
+            # Malformed feeds (bozo bit set) are still processed
+            pytest.param(
+                {"title": "Test Magazine", "link": "https://example.com/test"},
+                "Magazine",
+                True,
+                ["Test Magazine"],
+                None,
+                id="bozo_feed",
+            ),
+        ],
+    )
+    def test_search_single_entry(self, mock_parse, rss_provider, fields, query, bozo, expected_titles, check):
+        """Test search filtering and result mapping for a single-entry feed."""
+        mock_parse.return_value = make_feed(
+            [make_entry(**fields)],
+            bozo=bozo,
+            bozo_exception=Exception("Malformed XML") if bozo else None,
+        )
+
+        results = rss_provider.search(query)
+
+        assert [r.title for r in results] == expected_titles
+        if check:
+            assert all(check(r) for r in results)
+
+    def test_search_extracts_publication_date(self, mock_parse, rss_provider):
         """Test search extracts publication_date from published_parsed field."""
-        config = {"type": "rss", "feed_url": "https://example.com/feed.xml"}
-        provider = RSSProvider(config)
-
-        entry = Mock()
-        entry.get = lambda key, default="": {
-            "title": "Magazine January 2024",
-            "link": "https://example.com/mag",
-        }.get(key, default)
-        entry.published_parsed = struct_time((2024, 1, 15, 14, 30, 45, 0, 0, 0))
+        entry = make_entry(
+            title="Magazine January 2024",
+            link="https://example.com/mag",
+            published_parsed=JAN_15_2024_AFTERNOON,
+        )
 
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.entries = [entry]
-        mock_parse.return_value = mock_feed
+        mock_parse.return_value = make_feed([entry])
 
-        results = provider.search("Magazine")
+        results = rss_provider.search("Magazine")
 
         assert len(results) == 1
         assert results[0].publication_date == datetime(2024, 1, 15, 14, 30, 45)
 
-    @patch("providers.rss.feedparser.parse")
-    def test_search_handles_missing_publication_date(self, mock_parse):
+    def test_search_handles_missing_publication_date(self, mock_parse, rss_provider):
         """Test search handles entries without published_parsed gracefully."""
-        config = {"type": "rss", "feed_url": "https://example.com/feed.xml"}
-        provider = RSSProvider(config)
-
-        entry = Mock()
-        entry.get = lambda key, default="": {
-            "title": "Magazine January 2024",
-            "link": "https://example.com/mag",
-        }.get(key, default)
-        delattr(entry, "published_parsed")  # No published_parsed attribute
+        entry = make_entry(
+            title="Magazine January 2024",
+            link="https://example.com/mag",
+        )
 
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.entries = [entry]
-        mock_parse.return_value = mock_feed
+        mock_parse.return_value = make_feed([entry])
 
-        results = provider.search("Magazine")
+        results = rss_provider.search("Magazine")
 
         assert len(results) == 1
         assert results[0].publication_date is None
 
-    @patch("providers.rss.feedparser.parse")
-    def test_search_includes_raw_metadata(self, mock_parse):
+    def test_search_includes_raw_metadata(self, mock_parse, rss_provider):
         """Test search includes summary and guid in raw_metadata."""
-        config = {"type": "rss", "feed_url": "https://example.com/feed.xml"}
-        provider = RSSProvider(config)
+        entry = make_entry(
+            title="Test Magazine",
+            link="https://example.com/test",
+            summary="A great magazine issue",
+            id="test-123",
+        )
 
-        entry = Mock()
-        entry.get = lambda key, default="": {
-            "title": "Test Magazine",
-            "link": "https://example.com/test",
-            "summary": "A great magazine issue",
-            "id": "test-123",
-        }.get(key, default)
-        delattr(entry, "published_parsed")
+        mock_parse.return_value = make_feed([entry])
 
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.entries = [entry]
-        mock_parse.return_value = mock_feed
-
-        results = provider.search("Magazine")
+        results = rss_provider.search("Magazine")
 
         assert len(results) == 1
         assert results[0].raw_metadata["summary"] == "A great magazine issue"
         assert results[0].raw_metadata["guid"] == "test-123"
 
-    @patch("providers.rss.feedparser.parse")
-    def test_search_handles_missing_optional_fields(self, mock_parse):
-        """Test search handles missing optional fields in RSS entries."""
-        config = {"type": "rss", "feed_url": "https://example.com/feed.xml"}
-        provider = RSSProvider(config)
-
-        entry = Mock()
-        entry.get = lambda key, default="": {
-            "title": "Test Magazine",
-        }.get(key, default)
-        delattr(entry, "published_parsed")
-
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.entries = [entry]
-        mock_parse.return_value = mock_feed
-
-        results = provider.search("Magazine")
-
-        assert len(results) == 1
-        assert results[0].url == ""
-        assert results[0].raw_metadata["summary"] == ""
-        assert results[0].raw_metadata["guid"] == ""
-
-    @patch("providers.rss.feedparser.parse")
-    def test_search_sets_provider_type(self, mock_parse):
-        """Test search results include correct provider type."""
-        config = {"type": "rss", "feed_url": "https://example.com/feed.xml"}
-        provider = RSSProvider(config)
-
-        entry = Mock()
-        entry.get = lambda key, default="": {
-            "title": "Test Magazine",
-            "link": "https://example.com/test",
-        }.get(key, default)
-        delattr(entry, "published_parsed")
-
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.entries = [entry]
-        mock_parse.return_value = mock_feed
-
-        results = provider.search("Magazine")
-
-        assert len(results) == 1
-        assert results[0].provider == "rss"
-
 
 class TestRSSProviderErrorHandling:
     """Test RSS provider error handling"""
 
-    @patch("providers.rss.feedparser.parse")
-    def test_search_handles_bozo_feed(self, mock_parse):
-        """Test search handles malformed RSS feeds (bozo bit set)."""
-        config = {"type": "rss", "feed_url": "https://example.com/feed.xml"}
-        provider = RSSProvider(config)
-
-        entry = Mock()
-        entry.get = lambda key, default="": {
-            "title": "Test Magazine",
-            "link": "https://example.com/test",
-        }.get(key, default)
-        delattr(entry, "published_parsed")
-
-        mock_feed = MagicMock()
-        mock_feed.bozo = True
-        mock_feed.bozo_exception = Exception("Malformed XML")
-        mock_feed.entries = [entry]
-        mock_parse.return_value = mock_feed
-
-        # Should still attempt to process entries despite bozo warning
-        results = provider.search("Magazine")
-
-        assert len(results) == 1
-        assert results[0].title == "Test Magazine"
-
-    @patch("providers.rss.feedparser.parse")
-    def test_search_handles_feedparser_exception(self, mock_parse):
+    def test_search_handles_feedparser_exception(self, mock_parse, rss_provider):
         """Test search handles exceptions from feedparser gracefully."""
-        config = {"type": "rss", "feed_url": "https://example.com/feed.xml"}
-        provider = RSSProvider(config)
-
         mock_parse.side_effect = Exception("Network error")
 
-        results = provider.search("Magazine")
+        results = rss_provider.search("Magazine")
 
         assert results == []
 
-    @patch("providers.rss.feedparser.parse")
-    def test_search_handles_invalid_date_format(self, mock_parse):
+    def test_search_handles_invalid_date_format(self, mock_parse, rss_provider):
         """Test search handles invalid published_parsed date gracefully."""
-        config = {"type": "rss", "feed_url": "https://example.com/feed.xml"}
-        provider = RSSProvider(config)
-
-        entry = Mock()
-        entry.get = lambda key, default="": {
-            "title": "Test Magazine",
-            "link": "https://example.com/test",
-            "summary": "",
-            "id": "",
-        }.get(key, default)
-
-        # Make published_parsed None (falsy but attribute exists)
-        entry.published_parsed = None
+        entry = make_entry(
+            title="Test Magazine",
+            link="https://example.com/test",
+            summary="",
+            id="",
+            # Make published_parsed None (falsy but attribute exists)
+            published_parsed=None,
+        )
 
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.entries = [entry]
-        mock_parse.return_value = mock_feed
+        mock_parse.return_value = make_feed([entry])
 
-        results = provider.search("Magazine")
+        results = rss_provider.search("Magazine")
 
         # Should still return result but with no publication date
         assert len(results) == 1
         assert results[0].publication_date is None
 
-    @patch("providers.rss.feedparser.parse")
-    def test_search_handles_empty_feed(self, mock_parse):
+    def test_search_handles_empty_feed(self, mock_parse, rss_provider):
         """Test search handles empty RSS feed (no entries)."""
-        config = {"type": "rss", "feed_url": "https://example.com/feed.xml"}
-        provider = RSSProvider(config)
-
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.entries = []
-        mock_parse.return_value = mock_feed
+        mock_parse.return_value = make_feed([])
 
-        results = provider.search("Magazine")
+        results = rss_provider.search("Magazine")
 
         assert results == []
 
-    @patch("providers.rss.feedparser.parse")
     def test_search_calls_feedparser_with_feed_url(self, mock_parse):
         """Test search calls feedparser.parse with configured feed URL."""
         config = {
@@ -391,10 +311,7 @@ class TestRSSProviderErrorHandling:
         }
         provider = RSSProvider(config)
 
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.entries = []
-        mock_parse.return_value = mock_feed
+        mock_parse.return_value = make_feed([])
 
         provider.search("Test")
 
@@ -404,45 +321,35 @@ class TestRSSProviderErrorHandling:
 class TestRSSProviderIntegration:
     """Integration tests for RSS provider"""
 
-    @patch("providers.rss.feedparser.parse")
-    def test_search_multiple_matching_entries(self, mock_parse):
+    def test_search_multiple_matching_entries(self, mock_parse, rss_provider):
         """Test searching feed with multiple matching entries."""
-        config = {"type": "rss", "feed_url": "https://example.com/feed.xml"}
-        provider = RSSProvider(config)
-
-        entry1 = Mock()
-        entry1.get = lambda key, default="": {
-            "title": "Wired Magazine January 2024",
-            "link": "https://example.com/wired-jan",
-            "summary": "Tech news",
-            "id": "wired-jan",
-        }.get(key, default)
-        entry1.published_parsed = struct_time((2024, 1, 1, 0, 0, 0, 0, 0, 0))
-
-        entry2 = Mock()
-        entry2.get = lambda key, default="": {
-            "title": "Wired Magazine February 2024",
-            "link": "https://example.com/wired-feb",
-            "summary": "AI developments",
-            "id": "wired-feb",
-        }.get(key, default)
-        entry2.published_parsed = struct_time((2024, 2, 1, 0, 0, 0, 0, 0, 0))
-
-        entry3 = Mock()
-        entry3.get = lambda key, default="": {
-            "title": "Wired Magazine March 2024",
-            "link": "https://example.com/wired-mar",
-            "summary": "Future tech",
-            "id": "wired-mar",
-        }.get(key, default)
-        entry3.published_parsed = struct_time((2024, 3, 1, 0, 0, 0, 0, 0, 0))
-
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.entries = [entry1, entry2, entry3]
-        mock_parse.return_value = mock_feed
-
-        results = provider.search("Wired")
+        entry1 = make_entry(
+            title="Wired Magazine January 2024",
+            link="https://example.com/wired-jan",
+            summary="Tech news",
+            id="wired-jan",
+            published_parsed=JAN_1_2024,
+        )
+
+        entry2 = make_entry(
+            title="Wired Magazine February 2024",
+            link="https://example.com/wired-feb",
+            summary="AI developments",
+            id="wired-feb",
+            published_parsed=FEB_1_2024,
+        )
+
+        entry3 = make_entry(
+            title="Wired Magazine March 2024",
+            link="https://example.com/wired-mar",
+            summary="Future tech",
+            id="wired-mar",
+            published_parsed=MAR_1_2024,
+        )
+
+        mock_parse.return_value = make_feed([entry1, entry2, entry3])
+
+        results = rss_provider.search("Wired")
 
         assert len(results) == 3
         assert all(r.provider == "rss" for r in results)
@@ -453,8 +360,7 @@ class TestRSSProviderIntegration:
         assert results[1].publication_date.month == 2
         assert results[2].publication_date.month == 3
 
-    @patch("providers.rss.feedparser.parse")
-    def test_provider_info_matches_config(self, mock_parse):
+    def test_provider_info_matches_config(self):
         """Test get_provider_info returns correct metadata."""
         config = {
             "type": "rss",
@@ -2,48 +2,89 @@
 Test suite for authentication router endpoints
 """
 
-import sys
-from pathlib import Path
+import hashlib
+import hmac
+import json
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.auth import AuthManager
-from models.database import Base, Credentials  # Import Credentials to register with Base
+from models.database import Credentials
 from web.routers import auth
 
+TEST_USERNAME = "testuser"
+TEST_PASSWORD = "testpass123"
+NEW_USERNAME = "newuser"
+NEW_PASSWORD = "newpass123"
+# At least 32 bytes so PyJWT signs HS256 tokens without a key-length warning
+TEST_JWT_SECRET = "test-secret-key-for-testing-only"
 
-@pytest.fixture(scope="module")
-def test_db():
-    """Create in-memory test database"""
-    # Use named in-memory database with check_same_thread=False for sharing across threads
-    engine = create_engine(
-        "sqlite:///file:test_db?mode=memory&cache=shared&uri=true",
-        connect_args={"check_same_thread": False},
-    )
-    Base.metadata.create_all(engine)
-    session_factory = sessionmaker(bind=engine)
-    yield engine, session_factory
-    engine.dispose()
 
+def _encode(payload):
+    """Serialize a request body once at import time"""
+    return json.dumps(payload).encode()
 
-@pytest.fixture(scope="module")
+
+# Pre-serialized request bodies, posted with content= and JSON_HEADERS
+JSON_HEADERS = {"Content-Type": "application/json"}
+LOGIN_BODY = _encode({"username": TEST_USERNAME, "password": TEST_PASSWORD})
+WRONG_PASSWORD_LOGIN_BODY = _encode({"username": TEST_USERNAME, "password": "wrongpass"})
+UNKNOWN_USER_LOGIN_BODY = _encode({"username": "nouser", "password": "somepass"})
+NEW_PASSWORD_LOGIN_BODY = _encode({"username": TEST_USERNAME, "password": NEW_PASSWORD})
+NEW_CREDENTIALS_LOGIN_BODY = _encode({"username": NEW_USERNAME, "password": NEW_PASSWORD})
+SETUP_BODY = _encode({"username": "admin", "password": "admin123"})
+CHANGE_PASSWORD_BODY = _encode({"old_password": TEST_PASSWORD, "new_password": NEW_PASSWORD})
+WRONG_CHANGE_PASSWORD_BODY = _encode({"old_password": "wrongpass", "new_password": NEW_PASSWORD})
+UPDATE_USERNAME_BODY = _encode({"current_password": TEST_PASSWORD, "username": NEW_USERNAME})
+UPDATE_PASSWORD_BODY = _encode({"current_password": TEST_PASSWORD, "new_password": NEW_PASSWORD})
+UPDATE_BOTH_BODY = _encode(
+    {"current_password": TEST_PASSWORD, "username": NEW_USERNAME, "new_password": NEW_PASSWORD}
+)
+WRONG_UPDATE_BODY = _encode({"current_password": "wrongpass", "username": NEW_USERNAME})
+
+
+def bearer(token):
+    """JSON request headers carrying a bearer token"""
+    return {**JSON_HEADERS, "Authorization": f"Bearer {token}"}
+
+
+def _sha256_hex(password):
+    return hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def unsalted_password_hashing():
+    """
+    Store SHA-256 digests instead of bcrypt hashes for this module.
+
+    These tests cover routing and status codes; the real bcrypt path is
+    still exercised by the full workflow tests.
+    """
+
+    def set_password(self, password):
+        self.password_hash = _sha256_hex(password)
+
+    def verify_password(self, password):
+        return hmac.compare_digest(self.password_hash, _sha256_hex(password))
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Credentials, "set_password", set_password)
+        mp.setattr(Credentials, "verify_password", verify_password)
+        yield
+
+
+@pytest.fixture
 def test_auth_manager(test_db):
-    """Create test auth manager with in-memory database"""
-    engine, session_factory = test_db
-    jwt_secret = "test-secret-key-for-testing-only"
-    auth_manager = AuthManager(session_factory, jwt_secret)
-    # Set it globally so all tests in this module use it
+    """Create test auth manager whose writes are rolled back after each test"""
+    _, session_factory = test_db
+    auth_manager = AuthManager(session_factory, TEST_JWT_SECRET)
     auth.set_auth_manager(auth_manager)
     return auth_manager
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def test_app():
     """Create test FastAPI app with auth router"""
     app = FastAPI(title="Test App")
@@ -51,20 +92,31 @@ def test_app():
     return app
 
 
-@pytest.fixture
-def test_client(test_auth_manager, test_app):
-    """Create test client with auth manager injected"""
-    with TestClient(test_app, raise_server_exceptions=True) as client:
-        # Re-set auth manager to ensure it's not overridden
-        auth.set_auth_manager(test_auth_manager)
+@pytest.fixture(scope="session")
+def app_client(test_app):
+    """Single TestClient so app startup runs once per session"""
+    with TestClient(test_app) as client:
         yield client
-        # Clean up credentials after each test to ensure isolation
-        session = test_auth_manager.session_factory()
-        try:
-            session.query(Credentials).delete()
-            session.commit()
-        finally:
-            session.close()
+
+
+@pytest.fixture
+def test_client(app_client, test_auth_manager):
+    """Shared test client; test_auth_manager injects this test's auth manager"""
+    return app_client
+
+
+@pytest.fixture
+def auth_token(test_client, test_auth_manager):
+    """Create the test credentials and return a token from logging in"""
+    test_auth_manager.create_credentials(TEST_USERNAME, TEST_PASSWORD)
+    response = test_client.post("/api/auth/login", content=LOGIN_BODY, headers=JSON_HEADERS)
+    return response.json()["token"]
+
+
+@pytest.fixture(scope="module")
+def signed_token():
+    """Token signed with the test secret; verification needs no stored credentials"""
+    return AuthManager(None, TEST_JWT_SECRET).create_token(TEST_USERNAME)
 
 
 class TestAuthStatus:
@@ -111,9 +163,7 @@ class TestSetupCredentials:
 
     def test_setup_success(self, test_client):
         """Test successful credentials setup"""
-        response = test_client.post(
-            "/api/auth/setup", json={"username": "admin", "password": "admin123"}
-        )
+        response = test_client.post("/api/auth/setup", content=SETUP_BODY, headers=JSON_HEADERS)
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
@@ -122,9 +172,7 @@ class TestSetupCredentials:
     def test_setup_duplicate(self, test_client, test_auth_manager):
         """Test setup fails when credentials already exist"""
         test_auth_manager.create_credentials("existing", "password123")
-        response = test_client.post(
-            "/api/auth/setup", json={"username": "admin", "password": "admin123"}
-        )
+        response = test_client.post("/api/auth/setup", content=SETUP_BODY, headers=JSON_HEADERS)
         assert response.status_code == 400
         data = response.json()
         assert "already exist" in data["detail"].lower()
@@ -136,9 +184,7 @@ class TestLogin:
     def test_login_success(self, test_client, test_auth_manager):
         """Test successful login"""
         test_auth_manager.create_credentials("testuser", "testpass123")
-        response = test_client.post(
-            "/api/auth/login", json={"username": "testuser", "password": "testpass123"}
-        )
+        response = test_client.post("/api/auth/login", content=LOGIN_BODY, headers=JSON_HEADERS)
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
@@ -150,7 +196,7 @@ class TestLogin:
         """Test login with wrong password"""
         test_auth_manager.create_credentials("testuser", "testpass123")
         response = test_client.post(
-            "/api/auth/login", json={"username": "testuser", "password": "wrongpass"}
+            "/api/auth/login", content=WRONG_PASSWORD_LOGIN_BODY, headers=JSON_HEADERS
         )
         assert response.status_code == 401
         data = response.json()
@@ -159,7 +205,7 @@ class TestLogin:
     def test_login_nonexistent_user(self, test_client):
         """Test login with nonexistent username"""
         response = test_client.post(
-            "/api/auth/login", json={"username": "nouser", "password": "somepass"}
+            "/api/auth/login", content=UNKNOWN_USER_LOGIN_BODY, headers=JSON_HEADERS
         )
         assert response.status_code == 401
         data = response.json()
@@ -169,20 +215,14 @@ class TestLogin:
 class TestTokenVerification:
     """Test token verification"""
 
-    def test_verify_valid_token(self, test_client, test_auth_manager):
+    def test_verify_valid_token(self, test_client, signed_token):
         """Test accessing protected endpoint with valid token"""
-        test_auth_manager.create_credentials("testuser", "testpass123")
-        login_response = test_client.post(
-            "/api/auth/login", json={"username": "testuser", "password": "testpass123"}
-        )
-        token = login_response.json()["token"]
-
         response = test_client.get(
-            "/api/auth/user/info", headers={"Authorization": f"Bearer {token}"}
+            "/api/auth/user/info", headers={"Authorization": f"Bearer {signed_token}"}
         )
         assert response.status_code == 200
         data = response.json()
-        assert data["username"] == "testuser"
+        assert data["username"] == TEST_USERNAME
 
     def test_verify_missing_token(self, test_client):
         """Test accessing protected endpoint without token"""
@@ -207,18 +247,12 @@ class TestTokenVerification:
 class TestChangePassword:
     """Test password change endpoint"""
 
-    def test_change_password_success(self, test_client, test_auth_manager):
+    def test_change_password_success(self, test_client, auth_token):
         """Test successful password change"""
-        test_auth_manager.create_credentials("testuser", "oldpass123")
-        login_response = test_client.post(
-            "/api/auth/login", json={"username": "testuser", "password": "oldpass123"}
-        )
-        token = login_response.json()["token"]
-
         response = test_client.post(
             "/api/auth/change-password",
-            json={"old_password": "oldpass123", "new_password": "newpass123"},
-            headers={"Authorization": f"Bearer {token}"},
+            content=CHANGE_PASSWORD_BODY,
+            headers=bearer(auth_token),
         )
         assert response.status_code == 200
         data = response.json()
@@ -226,22 +260,16 @@ class TestChangePassword:
 
         # Verify can login with new password
         new_login = test_client.post(
-            "/api/auth/login", json={"username": "testuser", "password": "newpass123"}
+            "/api/auth/login", content=NEW_PASSWORD_LOGIN_BODY, headers=JSON_HEADERS
         )
         assert new_login.status_code == 200
 
-    def test_change_password_wrong_old_password(self, test_client, test_auth_manager):
+    def test_change_password_wrong_old_password(self, test_client, auth_token):
         """Test password change with wrong old password"""
-        test_auth_manager.create_credentials("testuser", "oldpass123")
-        login_response = test_client.post(
-            "/api/auth/login", json={"username": "testuser", "password": "oldpass123"}
-        )
-        token = login_response.json()["token"]
-
         response = test_client.post(
             "/api/auth/change-password",
-            json={"old_password": "wrongpass", "new_password": "newpass123"},
-            headers={"Authorization": f"Bearer {token}"},
+            content=WRONG_CHANGE_PASSWORD_BODY,
+            headers=bearer(auth_token),
         )
         assert response.status_code == 400
 
@@ -249,84 +277,52 @@ class TestChangePassword:
 class TestUpdateUser:
     """Test user update endpoint"""
 
-    def test_update_username(self, test_client, test_auth_manager):
+    def test_update_username(self, test_client, auth_token):
         """Test updating username"""
-        test_auth_manager.create_credentials("olduser", "password123")
-        login_response = test_client.post(
-            "/api/auth/login", json={"username": "olduser", "password": "password123"}
-        )
-        token = login_response.json()["token"]
-
         response = test_client.post(
             "/api/auth/user/update",
-            json={"current_password": "password123", "username": "newuser"},
-            headers={"Authorization": f"Bearer {token}"},
+            content=UPDATE_USERNAME_BODY,
+            headers=bearer(auth_token),
         )
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
 
-    def test_update_password(self, test_client, test_auth_manager):
+    def test_update_password(self, test_client, auth_token):
         """Test updating password through user update endpoint"""
-        test_auth_manager.create_credentials("testuser", "oldpass123")
-        login_response = test_client.post(
-            "/api/auth/login", json={"username": "testuser", "password": "oldpass123"}
-        )
-        token = login_response.json()["token"]
-
         response = test_client.post(
             "/api/auth/user/update",
-            json={"current_password": "oldpass123", "new_password": "newpass123"},
-            headers={"Authorization": f"Bearer {token}"},
+            content=UPDATE_PASSWORD_BODY,
+            headers=bearer(auth_token),
         )
         assert response.status_code == 200
 
         # Verify new password works
         new_login = test_client.post(
-            "/api/auth/login", json={"username": "testuser", "password": "newpass123"}
+            "/api/auth/login", content=NEW_PASSWORD_LOGIN_BODY, headers=JSON_HEADERS
         )
         assert new_login.status_code == 200
 
-    def test_update_both(self, test_client, test_auth_manager):
+    def test_update_both(self, test_client, auth_token):
         """Test updating both username and password"""
-        test_auth_manager.create_credentials("olduser", "oldpass123")
-        login_response = test_client.post(
-            "/api/auth/login", json={"username": "olduser", "password": "oldpass123"}
-        )
-        token = login_response.json()["token"]
-
         response = test_client.post(
             "/api/auth/user/update",
-            json={
-                "current_password": "oldpass123",
-                "username": "newuser",
-                "new_password": "newpass123",
-            },
-            headers={"Authorization": f"Bearer {token}"},
+            content=UPDATE_BOTH_BODY,
+            headers=bearer(auth_token),
         )
         assert response.status_code == 200
 
         # Verify new credentials work
         new_login = test_client.post(
-            "/api/auth/login", json={"username": "newuser", "password": "newpass123"}
+            "/api/auth/login", content=NEW_CREDENTIALS_LOGIN_BODY, headers=JSON_HEADERS
         )
         assert new_login.status_code == 200
 
-    def test_update_wrong_current_password(self, test_client, test_auth_manager):
+    def test_update_wrong_current_password(self, test_client, auth_token):
         """Test update fails with wrong current password"""
-        test_auth_manager.create_credentials("testuser", "password123")
-        login_response = test_client.post(
-            "/api/auth/login", json={"username": "testuser", "password": "password123"}
-        )
-        token = login_response.json()["token"]
-
         response = test_client.post(
             "/api/auth/user/update",
-            json={"current_password": "wrongpass", "username": "newuser"},
-            headers={"Authorization": f"Bearer {token}"},
+            content=WRONG_UPDATE_BODY,
+            headers=bearer(auth_token),
         )
         assert response.status_code == 401
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v", "--tb=short"])
@@ -3,14 +3,11 @@ Test suite for config router API endpoints
 Tests the masking of sensitive data and preservation of API keys
 """
 
-import sys
-from pathlib import Path
+import copy
 from unittest.mock import MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from web.routers.config import _mask_sensitive_config, _deep_merge
 
 
@@ -112,214 +109,142 @@ class TestMaskSensitiveConfig:
         assert original_config["search_providers"][0]["api_key"] == "original_secret_key"
         assert original_config["download_client"]["api_key"] == "original_download_key"
 
-
-class TestDeepMerge:
-    """Test deep merge functionality for config updates"""
-
-    def test_preserve_search_provider_api_keys_when_masked(self):
-        """Test that masked API keys are preserved from base config"""
-        base = {
-            "search_providers": [
-                {"name": "Provider1", "api_key": "real_secret_123", "api_url": "http://example.com"},
-                {"name": "Provider2", "api_key": "real_secret_456", "api_url": "http://example2.com"}
-            ]
-        }
-
-        update = {
-            "search_providers": [
-                {"name": "Provider1", "api_key": "***", "api_url": "http://example.com"},
-                {"name": "Provider2", "api_key": "***", "api_url": "http://example2.com"}
-            ]
-        }
-
-        result = _deep_merge(base, update)
-
-        # API keys should be preserved from base
-        assert result["search_providers"][0]["api_key"] == "real_secret_123"
-        assert result["search_providers"][1]["api_key"] == "real_secret_456"
-
-    def test_update_search_provider_api_key_when_not_masked(self):
-        """Test that real API keys are updated when provided"""
-        base = {
-            "search_providers": [
-                {"name": "Provider1", "api_key": "old_key", "api_url": "http://example.com"}
-            ]
-        }
-
-        update = {
-            "search_providers": [
-                {"name": "Provider1", "api_key": "new_real_key", "api_url": "http://example.com"}
-            ]
-        }
-
-        result = _deep_merge(base, update)
-
-        # API key should be updated to new value
-        assert result["search_providers"][0]["api_key"] == "new_real_key"
-
-    def test_preserve_download_client_api_key_when_masked(self):
-        """Test that masked download client API key is preserved"""
-        base = {
-            "download_client": {
-                "type": "sabnzbd",
-                "api_url": "http://localhost:8080",
-                "api_key": "real_download_key"
-            }
-        }
-
-        update = {
-            "download_client": {
-                "type": "sabnzbd",
-                "api_url": "http://localhost:8080",
-                "api_key": "***"
-            }
-        }
-
-        result = _deep_merge(base, update)
-
-        # API key should be preserved from base
-        assert result["download_client"]["api_key"] == "real_download_key"
-
-    def test_update_download_client_api_key_when_not_masked(self):
-        """Test that download client API key is updated when real value provided"""
-        base = {
-            "download_client": {
-                "type": "sabnzbd",
-                "api_key": "old_key"
-            }
-        }
-
-        update = {
-            "download_client": {
-                "type": "sabnzbd",
-                "api_key": "new_real_key"
-            }
-        }
-
-        result = _deep_merge(base, update)
-
-        # API key should be updated
-        assert result["download_client"]["api_key"] == "new_real_key"
-
-    def test_mixed_masked_and_real_keys(self):
-        """Test updating with a mix of masked and real API keys"""
-        base = {
-            "search_providers": [
-                {"name": "Provider1", "api_key": "real_key_1", "api_url": "http://example1.com"},
-                {"name": "Provider2", "api_key": "real_key_2", "api_url": "http://example2.com"}
-            ]
+    def test_mask_nested_non_provider_api_key(self):
+        """Test that an api_key at any depth is masked, not just provider keys"""
+        config = {
+            "notifications": {"webhook": {"url": "http://hooks.example.com", "api_key": "hook_secret"}},
+            "metadata_providers": [{"name": "Meta", "auth": {"api_key": "meta_secret"}}],
         }
 
-        update = {
-            "search_providers": [
-                {"name": "Provider1", "api_key": "***", "api_url": "http://example1.com"},  # Masked - preserve
-                {"name": "Provider2", "api_key": "new_key_2", "api_url": "http://example2.com"}  # Real - update
-            ]
-        }
+        masked = _mask_sensitive_config(config)
 
-        result = _deep_merge(base, update)
+        assert masked["notifications"]["webhook"]["api_key"] == "***"
+        assert masked["notifications"]["webhook"]["url"] == "http://hooks.example.com"
+        assert masked["metadata_providers"][0]["auth"]["api_key"] == "***"
+        assert config["notifications"]["webhook"]["api_key"] == "hook_secret"
 
-        # First provider's key should be preserved
-        assert result["search_providers"][0]["api_key"] == "real_key_1"
-        # Second provider's key should be updated
-        assert result["search_providers"][1]["api_key"] == "new_key_2"
 
-    def test_preserve_other_fields_while_updating_api_key(self):
-        """Test that non-API key fields are updated correctly"""
-        base = {
-            "search_providers": [
-                {"name": "OldName", "api_key": "real_key", "api_url": "http://old.com", "enabled": False}
-            ]
-        }
+def _get(config, path):
+    """Follow a tuple of dict keys / list indexes into a nested config"""
+    for key in path:
+        config = config[key]
+    return config
 
-        update = {
-            "search_providers": [
-                {"name": "NewName", "api_key": "***", "api_url": "http://new.com", "enabled": True}
-            ]
-        }
-
-        result = _deep_merge(base, update)
 
-        # API key should be preserved
-        assert result["search_providers"][0]["api_key"] == "real_key"
-        # Other fields should be updated
-        assert result["search_providers"][0]["name"] == "NewName"
-        assert result["search_providers"][0]["api_url"] == "http://new.com"
-        assert result["search_providers"][0]["enabled"] is True
+# Provider payloads shared by several merge cases; _deep_merge must not mutate them
+_PROVIDER1 = {"name": "Provider1", "api_key": "real_key_1", "api_url": "http://example1.com"}
+_PROVIDER2 = {"name": "Provider2", "api_key": "real_key_2", "api_url": "http://example2.com"}
+_MASKED_PROVIDER1 = {**_PROVIDER1, "api_key": "***"}
+_BASE_TWO_PROVIDERS = {"search_providers": [_PROVIDER1, _PROVIDER2]}
 
-    def test_add_new_provider_with_real_key(self):
-        """Test adding a new provider with a real API key"""
-        base = {
+# (base, update, [(path, expected value), ...]) for _deep_merge
+DEEP_MERGE_CASES = [
+    pytest.param(
+        {
             "search_providers": [
-                {"name": "Provider1", "api_key": "real_key_1", "api_url": "http://example1.com"}
+                {"name": "Provider1", "api_key": "real_secret_123", "api_url": "http://example.com"},
+                {"name": "Provider2", "api_key": "real_secret_456", "api_url": "http://example2.com"}
             ]
-        }
-
-        update = {
+        },
+        {
             "search_providers": [
-                {"name": "Provider1", "api_key": "***", "api_url": "http://example1.com"},
-                {"name": "Provider2", "api_key": "new_real_key_2", "api_url": "http://example2.com"}
+                {"name": "Provider1", "api_key": "***", "api_url": "http://example.com"},
+                {"name": "Provider2", "api_key": "***", "api_url": "http://example2.com"}
             ]
-        }
-
-        result = _deep_merge(base, update)
-
-        # First provider's key should be preserved
-        assert result["search_providers"][0]["api_key"] == "real_key_1"
-        # New provider should have the new key
-        assert result["search_providers"][1]["api_key"] == "new_real_key_2"
-
-    def test_handle_mismatched_provider_counts(self):
-        """Test handling when provider arrays have different lengths"""
-        base = {
+        },
+        # API keys should be preserved from base
+        [
+            (("search_providers", 0, "api_key"), "real_secret_123"),
+            (("search_providers", 1, "api_key"), "real_secret_456"),
+        ],
+        id="preserve_search_provider_api_keys_when_masked",
+    ),
+    pytest.param(
+        {"search_providers": [{"name": "Provider1", "api_key": "old_key", "api_url": "http://example.com"}]},
+        {"search_providers": [{"name": "Provider1", "api_key": "new_real_key", "api_url": "http://example.com"}]},
+        [(("search_providers", 0, "api_key"), "new_real_key")],
+        id="update_search_provider_api_key_when_not_masked",
+    ),
+    pytest.param(
+        {"download_client": {"type": "sabnzbd", "api_url": "http://localhost:8080", "api_key": "real_download_key"}},
+        {"download_client": {"type": "sabnzbd", "api_url": "http://localhost:8080", "api_key": "***"}},
+        [(("download_client", "api_key"), "real_download_key")],
+        id="preserve_download_client_api_key_when_masked",
+    ),
+    pytest.param(
+        {"download_client": {"type": "sabnzbd", "api_key": "old_key"}},
+        {"download_client": {"type": "sabnzbd", "api_key": "new_real_key"}},
+        [(("download_client", "api_key"), "new_real_key")],
+        id="update_download_client_api_key_when_not_masked",
+    ),
+    pytest.param(
+        _BASE_TWO_PROVIDERS,
+        {
             "search_providers": [
-                {"name": "Provider1", "api_key": "real_key_1", "api_url": "http://example1.com"},
-                {"name": "Provider2", "api_key": "real_key_2", "api_url": "http://example2.com"}
+                _MASKED_PROVIDER1,  # Masked - preserve
+                {**_PROVIDER2, "api_key": "new_key_2"}  # Real - update
             ]
-        }
-
+        },
+        [
+            (("search_providers", 0, "api_key"), "real_key_1"),
+            (("search_providers", 1, "api_key"), "new_key_2"),
+        ],
+        id="mixed_masked_and_real_keys",
+    ),
+    pytest.param(
+        {"search_providers": [{"name": "OldName", "api_key": "real_key", "api_url": "http://old.com", "enabled": False}]},
+        {"search_providers": [{"name": "NewName", "api_key": "***", "api_url": "http://new.com", "enabled": True}]},
+        # API key preserved, other fields updated
+        [
+            (("search_providers", 0), {
+                "name": "NewName", "api_key": "real_key", "api_url": "http://new.com", "enabled": True
+            }),
+        ],
+        id="preserve_other_fields_while_updating_api_key",
+    ),
+    pytest.param(
+        {"search_providers": [_PROVIDER1]},
+        {"search_providers": [_MASKED_PROVIDER1, {**_PROVIDER2, "api_key": "new_real_key_2"}]},
+        [
+            (("search_providers", 0, "api_key"), "real_key_1"),
+            (("search_providers", 1, "api_key"), "new_real_key_2"),
+        ],
+        id="add_new_provider_with_real_key",
+    ),
+    pytest.param(
+        _BASE_TWO_PROVIDERS,
         # Update has only one provider (e.g., user removed one)
-        update = {
-            "search_providers": [
-                {"name": "Provider1", "api_key": "***", "api_url": "http://example1.com"}
-            ]
-        }
-
-        result = _deep_merge(base, update)
-
-        # Should have only one provider with preserved key
-        assert len(result["search_providers"]) == 1
-        assert result["search_providers"][0]["api_key"] == "real_key_1"
-
-    def test_deep_merge_nested_dicts(self):
-        """Test that nested dictionaries are merged correctly"""
-        base = {
-            "storage": {
-                "db_path": "/old/path",
-                "download_dir": "/downloads"
-            }
-        }
-
-        update = {
-            "storage": {
-                "db_path": "/new/path"
-            }
-        }
-
-        result = _deep_merge(base, update)
-
-        # Updated field should change
-        assert result["storage"]["db_path"] == "/new/path"
-        # Non-updated field should be preserved
-        assert result["storage"]["download_dir"] == "/downloads"
-
-    def test_regression_bug_scenario(self):
-        """
-        Test the original bug scenario:
-        UI sends masked config back to server, which should preserve real keys
-        """
-        # Simulate real config loaded from file
-        base_config = {
+        {"search_providers": [_MASKED_PROVIDER1]},
+        [(("search_providers",), [_PROVIDER1])],
+        id="handle_mismatched_provider_counts",
+    ),
+    pytest.param(
+        {"storage": {"db_path": "/old/path", "download_dir": "/downloads"}},
+        {"storage": {"db_path": "/new/path"}},
+        [
+            (("storage", "db_path"), "/new/path"),
+            (("storage", "download_dir"), "/downloads"),
+        ],
+        id="nested_dicts",
+    ),
+    pytest.param(
+        {"notifications": {"webhook": {"url": "http://old.example.com", "api_key": "hook_secret"}}},
+        {"notifications": {"webhook": {"url": "http://new.example.com", "api_key": "***"}}},
+        [
+            (("notifications", "webhook", "api_key"), "hook_secret"),
+            (("notifications", "webhook", "url"), "http://new.example.com"),
+        ],
+        id="preserve_nested_non_provider_api_key_when_masked",
+    ),
+    pytest.param(
+        {"notifications": {}},
+        {"notifications": {"api_key": "***"}},
+        [(("notifications", "api_key"), "")],
+        id="masked_api_key_without_original_becomes_empty",
+    ),
+    # Original bug: UI sends masked config back to server, which should preserve real keys
+    pytest.param(
+        {
             "search_providers": [
                 {"name": "Provider1", "api_key": "super_secret_key_123", "api_url": "http://api.example.com"}
             ],
@@ -328,24 +253,39 @@ class TestDeepMerge:
                 "api_url": "http://localhost:8080",
                 "api_key": "download_secret_456"
             }
-        }
+        },
+        {"search_providers": [{"name": "Provider1", "api_key": "***", "api_url": "http://api.example.com"}]},
+        [
+            (("search_providers", 0, "api_key"), "super_secret_key_123"),
+            (("download_client", "api_key"), "download_secret_456"),
+        ],
+        id="regression_bug_scenario",
+    ),
+]
 
-        # Simulate what UI would send (masked values from a previous GET request)
-        ui_update = {
-            "search_providers": [
-                {"name": "Provider1", "api_key": "***", "api_url": "http://api.example.com"}
-            ]
-        }
 
-        result = _deep_merge(base_config, ui_update)
+class TestDeepMerge:
+    """Test deep merge functionality for config updates"""
 
-        # The real keys should be preserved, NOT overwritten with "***"
-        assert result["search_providers"][0]["api_key"] == "super_secret_key_123"
-        assert result["search_providers"][0]["api_key"] != "***"
+    @pytest.mark.parametrize("base,update,expected", DEEP_MERGE_CASES)
+    def test_deep_merge(self, base, update, expected):
+        """Test _deep_merge result values and masked key preservation"""
+        base_before, update_before = copy.deepcopy(base), copy.deepcopy(update)
+
+        result = _deep_merge(base, update)
 
-        # Download client should remain unchanged
-        assert result["download_client"]["api_key"] == "download_secret_456"
+        for path, value in expected:
+            assert _get(result, path) == value
+        assert base == base_before and update == update_before
+
+    def test_masked_round_trip_keeps_secrets(self):
+        """Test merging the masked config back unchanged restores every original secret"""
+        config = {
+            "search_providers": [{"name": "Provider1", "api_key": "provider_secret"}],
+            "download_client": {"type": "sabnzbd", "api_key": "download_secret"},
+            "notifications": {"webhook": {"api_key": "hook_secret"}},
+        }
 
+        result = _deep_merge(config, _mask_sensitive_config(config))
 
-if __name__ == "__main__":
-    pytest.main([__file__, "-v", "--tb=short"])
+        assert result == config
@@ -2,30 +2,35 @@
 Test suite for download router endpoints
 """
 
-import sys
-from pathlib import Path
+from datetime import datetime
 from unittest.mock import Mock, patch
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import func, select, text
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from models.database import Base, DownloadSubmission, MagazineTracking
+from models.database import DownloadSubmission, Magazine, MagazineTracking
 from services import DownloadManager
 
 
-@pytest.fixture
-def test_db():
-    """Create in-memory test database"""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    session_factory = sessionmaker(bind=engine)
-    return engine, session_factory
+def _mk_tracking(**kw):
+    """Build a tracking record with test defaults"""
+    return MagazineTracking(olid=kw.pop("olid", "test_mag"), title=kw.pop("title", "Test"), **kw)
+
 
+def _mk_submission(tracking_id, n=1, **kw):
+    """Build the n-th download submission for a tracking record with test defaults"""
+    defaults = {
+        "job_id": f"job_{n}",
+        "status": DownloadSubmission.StatusEnum.PENDING,
+        "source_url": f"http://example.com/{n}.nzb",
+        "result_title": f"Issue {n}",
+        "fuzzy_match_group": f"issue-{n}",
+        "client_name": "TestClient",
+    }
+    return DownloadSubmission(tracking_id=tracking_id, **{**defaults, **kw})
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_download_client():
     """Create mock download client"""
     client = Mock()
@@ -38,7 +43,7 @@ def mock_download_client():
     return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_search_provider():
     """Create mock search provider"""
     provider = Mock()
@@ -48,7 +53,7 @@ def mock_search_provider():
     return provider
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def download_manager(mock_search_provider, mock_download_client):
     """Create download manager with mocks"""
     return DownloadManager(
@@ -58,20 +63,24 @@ def download_manager(mock_search_provider, mock_download_client):
     )
 
 
+@pytest.fixture(autouse=True)
+def reset_mocks(mock_download_client, mock_search_provider):
+    """Clear call history on the module-scoped mocks after each test"""
+    yield
+    mock_download_client.reset_mock()
+    mock_search_provider.reset_mock()
+
+
 class TestDownloadSubmission:
     """Test download submission functionality"""
 
     def test_submit_single_download(self, test_db, download_manager):
         """Test submitting a single download"""
-        engine, session_factory = test_db
+        _, session_factory = test_db
         session = session_factory()
 
         # Create tracking record
-        tracking = MagazineTracking(
-            olid="test_magazine",
-            title="Test Magazine",
-            track_all_editions=False,
-        )
+        tracking = _mk_tracking(olid="test_magazine", title="Test Magazine")
         session.add(tracking)
         session.commit()
 
@@ -97,15 +106,11 @@ class TestDownloadSubmission:
 
     def test_submit_duplicate_prevention(self, test_db, download_manager):
         """Test that duplicate downloads are prevented"""
-        engine, session_factory = test_db
+        _, session_factory = test_db
         session = session_factory()
 
         # Create tracking record
-        tracking = MagazineTracking(
-            olid="test_magazine",
-            title="Test Magazine",
-            track_all_editions=False,
-        )
+        tracking = _mk_tracking(olid="test_magazine", title="Test Magazine")
         session.add(tracking)
         session.commit()
 
@@ -136,41 +141,78 @@ class TestDownloadSubmission:
         assert submission2 is None  # Should be rejected as duplicate
 
         # Verify duplicate was recorded as SKIPPED
-        skipped = (
-            session.query(DownloadSubmission)
-            .filter(DownloadSubmission.status == DownloadSubmission.StatusEnum.SKIPPED)
-            .count()
-        )
+        skipped = session.execute(
+            select(func.count())
+            .select_from(DownloadSubmission)
+            .where(DownloadSubmission.status == DownloadSubmission.StatusEnum.SKIPPED)
+        ).scalar_one()
         assert skipped == 1
 
         session.close()
 
+    def test_duplicate_check_finds_library_item(self, test_db, download_manager):
+        """Test that a result already in the library is reported as duplicate"""
+        _, session_factory = test_db
+        session = session_factory()
+
+        tracking = _mk_tracking(olid="test_magazine", title="Test Magazine")
+        session.add(tracking)
+        session.flush()
+        session.add(
+            Magazine(
+                title="Test Magazine",
+                language="English",
+                issue_date=datetime(2023, 12, 1),
+                file_path="/library/test-magazine-dec2023.pdf",
+                tracking_id=tracking.id,
+            )
+        )
+        session.commit()
+
+        is_dup, existing = download_manager.check_duplicate_submission(
+            tracking.id, "Test Magazine - Dec 2023", session
+        )
+
+        assert is_dup is True
+        assert existing is None
+
+        session.close()
+
+    @pytest.mark.parametrize(
+        "where,index",
+        [
+            ("tracking_id = 1 AND fuzzy_match_group = 'x'", "ix_dl_tracking_group"),
+            ("tracking_id = 1 AND status = 'PENDING'", "ix_dl_tracking_status"),
+        ],
+    )
+    def test_submission_lookups_use_composite_indexes(self, test_db, where, index):
+        """Test that per-periodical submission lookups are index searches"""
+        _, session_factory = test_db
+        session = session_factory()
+
+        plan = session.execute(
+            text(f"EXPLAIN QUERY PLAN SELECT * FROM download_submissions WHERE {where}")
+        ).all()
+
+        assert any(f"USING INDEX {index}" in row[-1] for row in plan)
+
+        session.close()
+
 
 class TestDownloadStatusTracking:
     """Test download status tracking"""
 
     def test_update_download_status(self, test_db, download_manager):
         """Test updating download status from client"""
-        engine, session_factory = test_db
+        _, session_factory = test_db
         session = session_factory()
 
         # Create tracking and submission
-        tracking = MagazineTracking(
-            olid="test_magazine",
-            title="Test Magazine",
-        )
+        tracking = _mk_tracking(olid="test_magazine", title="Test Magazine")
         session.add(tracking)
         session.flush()
 
-        submission = DownloadSubmission(
-            tracking_id=tracking.id,
-            job_id="job_123",
-            status=DownloadSubmission.StatusEnum.PENDING,
-            source_url="http://example.com/test.nzb",
-            result_title="Test Issue",
-            fuzzy_match_group="test-issue",
-            client_name="TestClient",
-        )
+        submission = _mk_submission(tracking.id, job_id="job_123")
         session.add(submission)
         session.commit()
 
@@ -183,56 +225,38 @@ class TestDownloadStatusTracking:
 
         session.close()
 
-    def test_get_pending_downloads(self, test_db, download_manager):
-        """Test retrieving pending downloads"""
-        engine, session_factory = test_db
+    @pytest.mark.parametrize(
+        "query_fn,expected_jobs",
+        [
+            ("get_pending_downloads", {"job_1", "job_2"}),
+            ("get_completed_downloads", {"job_3"}),
+        ],
+    )
+    def test_get_downloads_by_status(self, test_db, download_manager, query_fn, expected_jobs):
+        """Test that pending/completed queries return only matching submissions"""
+        _, session_factory = test_db
         session = session_factory()
 
-        # Create tracking
-        tracking = MagazineTracking(olid="test_mag", title="Test")
+        tracking = _mk_tracking()
         session.add(tracking)
         session.flush()
 
-        # Create mix of submissions
-        pending = DownloadSubmission(
-            tracking_id=tracking.id,
-            job_id="job_1",
-            status=DownloadSubmission.StatusEnum.PENDING,
-            source_url="http://example.com/1.nzb",
-            result_title="Issue 1",
-            fuzzy_match_group="issue-1",
-            client_name="TestClient",
-        )
-        downloading = DownloadSubmission(
-            tracking_id=tracking.id,
-            job_id="job_2",
-            status=DownloadSubmission.StatusEnum.DOWNLOADING,
-            source_url="http://example.com/2.nzb",
-            result_title="Issue 2",
-            fuzzy_match_group="issue-2",
-            client_name="TestClient",
-        )
-        completed = DownloadSubmission(
-            tracking_id=tracking.id,
-            job_id="job_3",
-            status=DownloadSubmission.StatusEnum.COMPLETED,
-            source_url="http://example.com/3.nzb",
-            result_title="Issue 3",
-            fuzzy_match_group="issue-3",
-            client_name="TestClient",
-            file_path="/test/job_3.pdf",
+        # One submission per status; the last completed one was already processed
+        session.add_all(
+            [
+                _mk_submission(tracking.id, 1),
+                _mk_submission(tracking.id, 2, status=DownloadSubmission.StatusEnum.DOWNLOADING),
+                _mk_submission(
+                    tracking.id, 3, status=DownloadSubmission.StatusEnum.COMPLETED, file_path="/test/job_3.pdf"
+                ),
+                _mk_submission(tracking.id, 4, status=DownloadSubmission.StatusEnum.COMPLETED),
+            ]
         )
-
-        session.add_all([pending, downloading, completed])
         session.commit()
 
-        # Get pending downloads
-        active = download_manager.get_pending_downloads(session)
+        result = getattr(download_manager, query_fn)(session)
 
-        assert len(active) == 2
-        assert pending in active
-        assert downloading in active
-        assert completed not in active
+        assert {s.job_id for s in result} == expected_jobs
 
         session.close()
 
@@ -240,71 +264,18 @@ class TestDownloadStatusTracking:
 class TestDownloadCompletion:
     """Test download completion workflow"""
 
-    def test_get_completed_downloads(self, test_db, download_manager):
-        """Test retrieving completed downloads"""
-        engine, session_factory = test_db
-        session = session_factory()
-
-        # Create tracking
-        tracking = MagazineTracking(olid="test_mag", title="Test")
-        session.add(tracking)
-        session.flush()
-
-        # Create completed downloads
-        completed1 = DownloadSubmission(
-            tracking_id=tracking.id,
-            job_id="job_1",
-            status=DownloadSubmission.StatusEnum.COMPLETED,
-            source_url="http://example.com/1.nzb",
-            result_title="Issue 1",
-            fuzzy_match_group="issue-1",
-            client_name="TestClient",
-            file_path="/downloads/job_1.pdf",
-        )
-        completed2 = DownloadSubmission(
-            tracking_id=tracking.id,
-            job_id="job_2",
-            status=DownloadSubmission.StatusEnum.COMPLETED,
-            source_url="http://example.com/2.nzb",
-            result_title="Issue 2",
-            fuzzy_match_group="issue-2",
-            client_name="TestClient",
-            file_path="/downloads/job_2.pdf",
-        )
-
-        session.add_all([completed1, completed2])
-        session.commit()
-
-        # Get completed downloads
-        completed = download_manager.get_completed_downloads(session)
-
-        assert len(completed) == 2
-        assert all(
-            s.status == DownloadSubmission.StatusEnum.COMPLETED for s in completed
-        )
-        assert all(s.file_path is not None for s in completed)
-
-        session.close()
-
     def test_mark_processed(self, test_db, download_manager):
         """Test marking download as processed"""
-        engine, session_factory = test_db
+        _, session_factory = test_db
         session = session_factory()
 
         # Create tracking and completed submission
-        tracking = MagazineTracking(olid="test_mag", title="Test")
+        tracking = _mk_tracking()
         session.add(tracking)
         session.flush()
 
-        submission = DownloadSubmission(
-            tracking_id=tracking.id,
-            job_id="job_1",
-            status=DownloadSubmission.StatusEnum.COMPLETED,
-            source_url="http://example.com/1.nzb",
-            result_title="Issue 1",
-            fuzzy_match_group="issue-1",
-            client_name="TestClient",
-            file_path="/downloads/job_1.pdf",
+        submission = _mk_submission(
+            tracking.id, status=DownloadSubmission.StatusEnum.COMPLETED, file_path="/downloads/job_1.pdf"
         )
         session.add(submission)
         session.commit()
@@ -313,11 +284,15 @@ class TestDownloadCompletion:
         result = download_manager.mark_processed(submission.id, session)
 
         assert result is True
-        session.refresh(submission)
-        assert submission.file_path is None  # Indicates processed
+        # Processed submissions drop their file_path, so none are left to import
+        unprocessed = session.execute(
+            select(func.count())
+            .select_from(DownloadSubmission)
+            .where(
+                DownloadSubmission.status == DownloadSubmission.StatusEnum.COMPLETED,
+                DownloadSubmission.file_path.isnot(None),
+            )
+        ).scalar_one()
+        assert unprocessed == 0
 
         session.close()
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v", "--tb=short"])
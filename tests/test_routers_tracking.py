@@ -2,36 +2,20 @@
 Test suite for tracking router endpoints
 """
 
-import sys
 from datetime import UTC, datetime
-from pathlib import Path
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import insert
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from models.database import Base, MagazineTracking
-
-
-@pytest.fixture
-def test_db():
-    """Create in-memory test database"""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    session_factory = sessionmaker(bind=engine)
-    return engine, session_factory
+from models.database import Magazine, MagazineTracking
+from web.routers.tracking import merge_tracking, set_dependencies
 
 
 class TestTrackingCreation:
     """Test creating and managing tracking records"""
 
-    def test_create_tracking_record(self, test_db):
+    def test_create_tracking_record(self, db_session):
         """Test creating a new tracking record"""
-        engine, session_factory = test_db
-        session = session_factory()
-
         tracking = MagazineTracking(
             olid="OL12345W",
             title="National Geographic",
@@ -39,28 +23,23 @@ class TestTrackingCreation:
             track_all_editions=True,
             last_metadata_update=datetime.now(UTC),
         )
-        session.add(tracking)
-        session.commit()
+        db_session.add(tracking)
+        db_session.flush()
 
         # Verify created
-        retrieved = session.query(MagazineTracking).filter_by(olid="OL12345W").first()
+        retrieved = db_session.query(MagazineTracking).filter_by(olid="OL12345W").first()
         assert retrieved is not None
         assert retrieved.title == "National Geographic"
         assert retrieved.track_all_editions is True
 
-        session.close()
-
-    def test_tracking_defaults(self, test_db):
+    def test_tracking_defaults(self, db_session):
         """Test default values for tracking record"""
-        engine, session_factory = test_db
-        session = session_factory()
-
         tracking = MagazineTracking(
             olid="OL99999W",
             title="Test Magazine",
         )
-        session.add(tracking)
-        session.commit()
+        db_session.add(tracking)
+        db_session.flush()
 
         # Verify defaults
         assert tracking.track_all_editions is False
@@ -69,45 +48,34 @@ class TestTrackingCreation:
         assert tracking.selected_years == []
         assert tracking.total_editions_known == 0
 
-        session.close()
-
 
 class TestTrackingUpdates:
     """Test updating tracking preferences"""
 
-    def test_update_tracking_preferences(self, test_db):
+    def test_update_tracking_preferences(self, db_session):
         """Test updating tracking preferences"""
-        engine, session_factory = test_db
-        session = session_factory()
-
         # Create initial tracking
         tracking = MagazineTracking(
             olid="OL12345W",
             title="Wired Magazine",
             track_all_editions=False,
         )
-        session.add(tracking)
-        session.commit()
+        db_session.add(tracking)
+        db_session.flush()
 
         # Update preferences
         tracking.track_all_editions = True
         tracking.selected_years = [2020, 2021, 2022]
         tracking.last_metadata_update = datetime.now(UTC)
-        session.commit()
+        db_session.flush()
 
         # Verify updates
-        session.refresh(tracking)
         assert tracking.track_all_editions is True
         assert len(tracking.selected_years) == 3
         assert 2020 in tracking.selected_years
 
-        session.close()
-
-    def test_update_specific_editions(self, test_db):
+    def test_update_specific_editions(self, db_session):
         """Test selecting specific editions"""
-        engine, session_factory = test_db
-        session = session_factory()
-
         tracking = MagazineTracking(
             olid="OL12345W",
             title="Time Magazine",
@@ -117,43 +85,33 @@ class TestTrackingUpdates:
                 "OL333M": False,
             },
         )
-        session.add(tracking)
-        session.commit()
+        db_session.add(tracking)
+        db_session.flush()
 
         # Verify edition selections
         assert len(tracking.selected_editions) == 3
         assert tracking.selected_editions["OL111M"] is True
         assert tracking.selected_editions["OL333M"] is False
 
-        session.close()
-
 
 class TestTrackingQueries:
     """Test querying tracking records"""
 
-    def test_find_by_olid(self, test_db):
+    def test_find_by_olid(self, db_session):
         """Test finding tracking by Open Library ID"""
-        engine, session_factory = test_db
-        session = session_factory()
-
         # Create multiple tracking records
         tracking1 = MagazineTracking(olid="OL11111W", title="Magazine A")
         tracking2 = MagazineTracking(olid="OL22222W", title="Magazine B")
-        session.add_all([tracking1, tracking2])
-        session.commit()
+        db_session.add_all([tracking1, tracking2])
+        db_session.flush()
 
         # Find specific tracking
-        found = session.query(MagazineTracking).filter_by(olid="OL11111W").first()
+        found = db_session.query(MagazineTracking).filter_by(olid="OL11111W").first()
         assert found is not None
         assert found.title == "Magazine A"
 
-        session.close()
-
-    def test_find_tracking_all_editions(self, test_db):
+    def test_find_tracking_all_editions(self, db_session):
         """Test finding all periodicals tracking all editions"""
-        engine, session_factory = test_db
-        session = session_factory()
-
         # Create mix of tracking records
         track_all1 = MagazineTracking(
             olid="OL11111W",
@@ -170,73 +128,58 @@ class TestTrackingQueries:
             title="Magazine C",
             track_all_editions=True,
         )
-        session.add_all([track_all1, track_selective, track_all2])
-        session.commit()
+        db_session.add_all([track_all1, track_selective, track_all2])
+        db_session.flush()
 
         # Query for track_all_editions
         tracking_all = (
-            session.query(MagazineTracking).filter_by(track_all_editions=True).all()
+            db_session.query(MagazineTracking).filter_by(track_all_editions=True).all()
         )
         assert len(tracking_all) == 2
         assert all(t.track_all_editions for t in tracking_all)
 
-        session.close()
-
-    def test_find_by_year(self, test_db):
+    def test_find_by_year(self, db_session):
         """Test finding tracking records by selected years"""
-        engine, session_factory = test_db
-        session = session_factory()
-
         tracking = MagazineTracking(
             olid="OL12345W",
             title="Vintage Magazine",
             selected_years=[2020, 2021, 2022],
         )
-        session.add(tracking)
-        session.commit()
+        db_session.add(tracking)
+        db_session.flush()
 
         # Find by year (requires JSON field query in real app)
-        found = session.query(MagazineTracking).filter_by(olid="OL12345W").first()
+        found = db_session.query(MagazineTracking).filter_by(olid="OL12345W").first()
         assert 2021 in found.selected_years
 
-        session.close()
-
 
 class TestTrackingDeletion:
     """Test deleting tracking records"""
 
-    def test_delete_tracking(self, test_db):
+    def test_delete_tracking(self, db_session):
         """Test deleting a tracking record"""
-        engine, session_factory = test_db
-        session = session_factory()
-
         tracking = MagazineTracking(
             olid="OL12345W",
             title="Temporary Magazine",
         )
-        session.add(tracking)
-        session.commit()
+        db_session.add(tracking)
+        db_session.flush()
         tracking_id = tracking.id
 
         # Delete
-        session.delete(tracking)
-        session.commit()
+        db_session.delete(tracking)
+        db_session.flush()
 
         # Verify deleted
-        found = session.query(MagazineTracking).filter_by(id=tracking_id).first()
+        found = db_session.query(MagazineTracking).filter_by(id=tracking_id).first()
         assert found is None
 
-        session.close()
-
 
 class TestTrackingMetadata:
     """Test metadata storage in tracking records"""
 
-    def test_store_periodical_metadata(self, test_db):
+    def test_store_periodical_metadata(self, db_session):
         """Test storing periodical metadata"""
-        engine, session_factory = test_db
-        session = session_factory()
-
         metadata = {
             "description": "American news magazine",
             "covers": ["https://example.com/cover1.jpg"],
@@ -249,57 +192,46 @@ class TestTrackingMetadata:
             title="Time Magazine",
             periodical_metadata=metadata,
         )
-        session.add(tracking)
-        session.commit()
+        db_session.add(tracking)
+        db_session.flush()
 
         # Verify metadata stored correctly
-        session.refresh(tracking)
+        db_session.refresh(tracking)
         assert tracking.periodical_metadata["description"] == "American news magazine"
         assert len(tracking.periodical_metadata["subjects"]) == 3
 
-        session.close()
-
-    def test_update_metadata_timestamp(self, test_db):
+    def test_update_metadata_timestamp(self, db_session):
         """Test updating metadata timestamp"""
-        engine, session_factory = test_db
-        session = session_factory()
-
         tracking = MagazineTracking(
             olid="OL12345W",
             title="Test Magazine",
             last_metadata_update=None,
         )
-        session.add(tracking)
-        session.commit()
+        db_session.add(tracking)
+        db_session.flush()
 
         # Update metadata and timestamp
         tracking.periodical_metadata = {"test": "data"}
         tracking.last_metadata_update = datetime.now(UTC)
-        session.commit()
+        db_session.flush()
 
         # Verify timestamp updated
-        session.refresh(tracking)
         assert tracking.last_metadata_update is not None
         assert tracking.periodical_metadata["test"] == "data"
 
-        session.close()
-
 
 class TestTrackingUniqueness:
     """Test uniqueness constraints"""
 
-    def test_olid_uniqueness(self, test_db):
+    def test_olid_uniqueness(self, db_session):
         """Test that OLID can be shared for different language editions"""
-        engine, session_factory = test_db
-        session = session_factory()
-
         tracking1 = MagazineTracking(
             olid="OL12345W",
             title="Wired Magazine",
             language="English",
         )
-        session.add(tracking1)
-        session.commit()
+        db_session.add(tracking1)
+        db_session.flush()
 
         # Same OLID but different language - should be allowed
         tracking2 = MagazineTracking(
@@ -307,29 +239,25 @@ class TestTrackingUniqueness:
             title="Wired Magazine",
             language="German",
         )
-        session.add(tracking2)
-        session.commit()  # Should not raise - duplicate OLID with different language is allowed
+        db_session.add(tracking2)
+        db_session.flush()  # Should not raise - duplicate OLID with different language is allowed
 
         # Verify both exist
-        all_tracking = session.query(MagazineTracking).filter(
+        all_tracking = db_session.query(MagazineTracking).filter(
             MagazineTracking.olid == "OL12345W"
         ).all()
         assert len(all_tracking) == 2
 
-        session.close()
-
 
 class TestTrackingMerge:
     """Test merging tracking records and library items"""
 
-    def test_merge_tracking_updates_magazine_titles(self, test_db):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_merge_tracking_updates_magazine_titles(self, test_db):
         """Test that merging tracking records also updates magazine titles for library grouping"""
-        engine, session_factory = test_db
+        _, session_factory = test_db
         session = session_factory()
 
-        from models.database import Magazine
-        from web.routers.tracking import merge_tracking, set_dependencies
-
         # Set up dependencies
         set_dependencies(session_factory, None, None)
 
@@ -347,31 +275,35 @@ class TestTrackingMerge:
             last_metadata_update=datetime.now(UTC),
         )
         session.add_all([tracking1, tracking2])
-        session.commit()
+        session.flush()
 
         # Create magazines linked to each tracking record
-        mag1 = Magazine(
-            title="Wired",
-            language="English",
-            issue_date=datetime(2024, 1, 1),
-            file_path="/test/wired-jan2024.pdf",
-            tracking_id=tracking1.id,
-        )
-        mag2 = Magazine(
-            title="Wired Magazine",
-            language="English",
-            issue_date=datetime(2024, 2, 1),
-            file_path="/test/wired-feb2024.pdf",
-            tracking_id=tracking2.id,
+        session.execute(
+            insert(Magazine),
+            [
+                {
+                    "title": "Wired",
+                    "language": "English",
+                    "issue_date": datetime(2024, 1, 1),
+                    "file_path": "/test/wired-jan2024.pdf",
+                    "tracking_id": tracking1.id,
+                },
+                {
+                    "title": "Wired Magazine",
+                    "language": "English",
+                    "issue_date": datetime(2024, 2, 1),
+                    "file_path": "/test/wired-feb2024.pdf",
+                    "tracking_id": tracking2.id,
+                },
+                {
+                    "title": "Wired Magazine",
+                    "language": "English",
+                    "issue_date": datetime(2024, 3, 1),
+                    "file_path": "/test/wired-mar2024.pdf",
+                    "tracking_id": tracking2.id,
+                },
+            ],
         )
-        mag3 = Magazine(
-            title="Wired Magazine",
-            language="English",
-            issue_date=datetime(2024, 3, 1),
-            file_path="/test/wired-mar2024.pdf",
-            tracking_id=tracking2.id,
-        )
-        session.add_all([mag1, mag2, mag3])
         session.commit()
 
         # Verify we have 2 distinct titles before merge
@@ -386,11 +318,10 @@ class TestTrackingMerge:
         source_id = tracking2.id
 
         # Merge tracking2 into tracking1 (keep "Wired" as the target)
-        import asyncio
-        result = asyncio.run(merge_tracking(
+        result = await merge_tracking(
             target_id=target_id,
             source_ids={"source_ids": [source_id]}
-        ))
+        )
 
         # Verify merge results
         assert result["success"] is True
@@ -427,14 +358,12 @@ class TestTrackingMerge:
 
         session.close()
 
-    def test_merge_tracking_with_different_languages(self, test_db):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_merge_tracking_with_different_languages(self, test_db):
         """Test that merging preserves language differences while normalizing titles"""
-        engine, session_factory = test_db
+        _, session_factory = test_db
         session = session_factory()
 
-        from models.database import Magazine
-        from web.routers.tracking import merge_tracking, set_dependencies
-
         set_dependencies(session_factory, None, None)
 
         # Create tracking records
@@ -451,24 +380,28 @@ class TestTrackingMerge:
             last_metadata_update=datetime.now(UTC),
         )
         session.add_all([tracking1, tracking2])
-        session.commit()
+        session.flush()
 
         # Create magazines in different languages
-        mag1_en = Magazine(
-            title="National Geographic",
-            language="English",
-            issue_date=datetime(2024, 1, 1),
-            file_path="/test/natgeo-en-jan.pdf",
-            tracking_id=tracking1.id,
-        )
-        mag2_de = Magazine(
-            title="NatGeo Magazine",
-            language="German",
-            issue_date=datetime(2024, 1, 1),
-            file_path="/test/natgeo-de-jan.pdf",
-            tracking_id=tracking2.id,
+        session.execute(
+            insert(Magazine),
+            [
+                {
+                    "title": "National Geographic",
+                    "language": "English",
+                    "issue_date": datetime(2024, 1, 1),
+                    "file_path": "/test/natgeo-en-jan.pdf",
+                    "tracking_id": tracking1.id,
+                },
+                {
+                    "title": "NatGeo Magazine",
+                    "language": "German",
+                    "issue_date": datetime(2024, 1, 1),
+                    "file_path": "/test/natgeo-de-jan.pdf",
+                    "tracking_id": tracking2.id,
+                },
+            ],
         )
-        session.add_all([mag1_en, mag2_de])
         session.commit()
 
         # Save IDs before merge
@@ -476,11 +409,10 @@ class TestTrackingMerge:
         source_id = tracking2.id
 
         # Merge
-        import asyncio
-        asyncio.run(merge_tracking(
+        await merge_tracking(
             target_id=target_id,
             source_ids={"source_ids": [source_id]}
-        ))
+        )
 
         session.expire_all()
 
@@ -491,7 +423,6 @@ class TestTrackingMerge:
             assert mag.title == "National Geographic"
 
         # Should have 2 groups in library view (by title+language)
-        from sqlalchemy import func
         title_lang_groups = session.query(
             Magazine.title,
             Magazine.language
@@ -500,14 +431,12 @@ class TestTrackingMerge:
 
         session.close()
 
-    def test_merge_preserves_special_editions(self, test_db):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_merge_preserves_special_editions(self, test_db):
         """Test that merging preserves special edition titles and metadata"""
-        engine, session_factory = test_db
+        _, session_factory = test_db
         session = session_factory()
 
-        from models.database import Magazine
-        from web.routers.tracking import merge_tracking, set_dependencies
-
         set_dependencies(session_factory, None, None)
 
         # Create two tracking records
@@ -524,36 +453,39 @@ class TestTrackingMerge:
             last_metadata_update=datetime.now(UTC),
         )
         session.add_all([tracking1, tracking2])
-        session.commit()
+        session.flush()
 
         # Create regular and special edition magazines
-        regular_mag = Magazine(
-            title="National Geographic",
-            language="English",
-            issue_date=datetime(2024, 1, 1),
-            file_path="/lib/natgeo-jan2024.pdf",
-            tracking_id=tracking1.id,
+        session.execute(
+            insert(Magazine),
+            [
+                {
+                    "title": "National Geographic",
+                    "language": "English",
+                    "issue_date": datetime(2024, 1, 1),
+                    "file_path": "/lib/natgeo-jan2024.pdf",
+                    "tracking_id": tracking1.id,
+                },
+                {
+                    "title": "National Geographic Special Edition",
+                    "language": "English",
+                    "issue_date": datetime(2024, 1, 1),
+                    "file_path": "/lib/natgeo-special-jan2024.pdf",
+                    "tracking_id": tracking2.id,
+                    "extra_metadata": {"special_edition": "Special Edition"},
+                },
+            ],
         )
-        special_mag = Magazine(
-            title="National Geographic Special Edition",
-            language="English",
-            issue_date=datetime(2024, 1, 1),
-            file_path="/lib/natgeo-special-jan2024.pdf",
-            tracking_id=tracking2.id,
-            extra_metadata={"special_edition": "Special Edition"},
-        )
-        session.add_all([regular_mag, special_mag])
         session.commit()
 
         target_id = tracking1.id
         source_id = tracking2.id
 
         # Merge tracking2 into tracking1
-        import asyncio
-        asyncio.run(merge_tracking(
+        await merge_tracking(
             target_id=target_id,
             source_ids={"source_ids": [source_id]}
-        ))
+        )
 
         session.expire_all()
 
@@ -577,7 +509,3 @@ class TestTrackingMerge:
         assert special.extra_metadata.get("special_edition") == "Special Edition"
 
         session.close()
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v", "--tb=short"])
@@ -3,66 +3,84 @@ Test failed download tracking and bad file detection.
 Tests attempt counting, bad file filtering, and retry prevention.
 """
 
-import sys
-
-sys.path.insert(0, ".")
-
 import pytest
-from datetime import datetime, UTC
-from unittest.mock import Mock
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import insert
 
 from services import DownloadManager
-from models.database import Base, MagazineTracking, DownloadSubmission, SearchResult as DBSearchResult
+from models.database import MagazineTracking, DownloadSubmission
 from core.bases import DownloadClient
 
 
-@pytest.fixture
-def test_db():
-    """Create in-memory test database"""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    session_factory = sessionmaker(bind=engine)
-    return engine, session_factory
+class StubDownloadClient(DownloadClient):
+    """Download client that answers submit/get_status with settable canned responses"""
 
+    def __init__(self):
+        super().__init__({"name": "TestClient", "type": "test"})
+        self.reset()
 
-@pytest.fixture
-def mock_download_client():
-    """Create mock download client"""
-    client = Mock(spec=DownloadClient)
-    client.name = "TestClient"
-    client.submit.return_value = "test-job-123"
-    client.get_status.return_value = {"status": "pending", "progress": 0}
-    return client
+    def reset(self):
+        """Restore the default responses the tests start from"""
+        self.submit_return = "test-job-123"
+        self.status_return = {"status": "pending", "progress": 0}
 
+    def submit(self, nzb_url, title=None, category=None):
+        return self.submit_return
 
-@pytest.fixture
-def download_manager(mock_download_client):
-    """Create download manager with mock client"""
+    def get_status(self, job_id):
+        return self.status_return
+
+    def get_completed_downloads(self):
+        return []
+
+    def delete(self, job_id):
+        return True
+
+
+@pytest.fixture(scope="module")
+def download_client():
+    """Create stub download client"""
+    return StubDownloadClient()
+
+
+@pytest.fixture(scope="module")
+def download_manager(download_client):
+    """Create download manager with stub client"""
     return DownloadManager(
         search_providers=[],
-        download_client=mock_download_client,
+        download_client=download_client,
         fuzzy_threshold=80,
     )
 
 
+@pytest.fixture
+def tracking(db_session):
+    """Tracking record the seeded submissions belong to"""
+    tracking = MagazineTracking(olid="test", title="Test")
+    db_session.add(tracking)
+    db_session.flush()
+    return tracking
+
+
+@pytest.fixture(autouse=True)
+def reset_download_client(download_client):
+    """Restore the module-scoped client's responses after each test"""
+    yield
+    download_client.reset()
+
+
 class TestAttemptCounting:
     """Test that attempt_count increments on failures"""
 
-    def test_attempt_count_increments_on_failure(self, test_db, download_manager, mock_download_client):
+    def test_attempt_count_increments_on_failure(self, db_session, download_manager, download_client):
         """Test attempt count increases each time download fails"""
-        engine, session_factory = test_db
-        session = session_factory()
-
         # Create tracking record
         tracking = MagazineTracking(
             olid="test-mag",
             title="Test Magazine",
             track_all_editions=True,
         )
-        session.add(tracking)
-        session.commit()
+        db_session.add(tracking)
+        db_session.commit()
 
         # Create a submission
         submission = DownloadSubmission(
@@ -74,33 +92,28 @@ class TestAttemptCounting:
             fuzzy_match_group="test-issue",
             attempt_count=1,
         )
-        session.add(submission)
-        session.commit()
+        db_session.add(submission)
+        db_session.commit()
 
         # Simulate failure from client
-        mock_download_client.get_status.return_value = {"status": "failed", "error": "Download error"}
+        download_client.status_return = {"status": "failed", "error": "Download error"}
 
         # Update submission status (should increment attempt_count)
-        result = download_manager.update_submission_status("job-123", session)
+        result = download_manager.update_submission_status("job-123", db_session)
 
         assert result is not None
         assert result.status == DownloadSubmission.StatusEnum.FAILED
         assert result.attempt_count == 2
         assert result.last_error == "Download error"
 
-        session.close()
-
-    def test_attempt_count_starts_at_one(self, test_db, download_manager):
+    def test_attempt_count_starts_at_one(self, db_session, download_manager):
         """Test new submissions start with attempt_count=1"""
-        engine, session_factory = test_db
-        session = session_factory()
-
         tracking = MagazineTracking(
             olid="test-mag",
             title="Test Magazine",
         )
-        session.add(tracking)
-        session.commit()
+        db_session.add(tracking)
+        db_session.commit()
 
         search_result = {
             "title": "Test Issue",
@@ -108,22 +121,13 @@ class TestAttemptCounting:
             "provider": "test",
         }
 
-        submission = download_manager.submit_download(tracking.id, search_result, session)
+        submission = download_manager.submit_download(tracking.id, search_result, db_session)
 
         assert submission is not None
         assert submission.attempt_count == 1
 
-        session.close()
-
-    def test_multiple_failures_increment_count(self, test_db, download_manager, mock_download_client):
+    def test_multiple_failures_increment_count(self, db_session, tracking, download_manager, download_client):
         """Test attempt count increases with each failure"""
-        engine, session_factory = test_db
-        session = session_factory()
-
-        tracking = MagazineTracking(olid="test", title="Test")
-        session.add(tracking)
-        session.commit()
-
         submission = DownloadSubmission(
             tracking_id=tracking.id,
             job_id="job-456",
@@ -133,130 +137,63 @@ class TestAttemptCounting:
             fuzzy_match_group="bad-file",
             attempt_count=0,
         )
-        session.add(submission)
-        session.commit()
+        db_session.add(submission)
+        db_session.commit()
 
         # Fail three times
-        mock_download_client.get_status.return_value = {"status": "failed", "error": "Error"}
+        download_client.status_return = {"status": "failed", "error": "Error"}
 
         for expected_count in [1, 2, 3]:
-            result = download_manager.update_submission_status("job-456", session)
-            session.refresh(submission)
+            result = download_manager.update_submission_status("job-456", db_session)
+            assert result is submission  # Same identity-map object, already updated
             assert submission.attempt_count == expected_count
 
-        session.close()
+
+def _seed_failed(session, tracking_id, attempt_counts):
+    """Insert one FAILED submission per attempt count with a single executemany INSERT"""
+    session.execute(
+        insert(DownloadSubmission),
+        [
+            {
+                "tracking_id": tracking_id,
+                "status": DownloadSubmission.StatusEnum.FAILED,
+                "source_url": f"http://example.com/file{i}.nzb",
+                "result_title": f"File {i}",
+                "fuzzy_match_group": f"file-{i}",
+                "attempt_count": i,
+            }
+            for i in attempt_counts
+        ],
+    )
 
 
 class TestBadFileDetection:
     """Test bad file detection and filtering"""
 
-    def test_get_bad_files_returns_three_plus_failures(self, test_db, download_manager):
-        """Test get_bad_files returns only files with 3+ failures"""
-        engine, session_factory = test_db
-        session = session_factory()
-
-        tracking = MagazineTracking(olid="test", title="Test")
-        session.add(tracking)
-        session.commit()
-
-        # Create submissions with different failure counts
-        submissions = [
-            DownloadSubmission(
-                tracking_id=tracking.id,
-                status=DownloadSubmission.StatusEnum.FAILED,
-                source_url=f"http://example.com/file{i}.nzb",
-                result_title=f"File {i}",
-                fuzzy_match_group=f"file-{i}",
-                attempt_count=i,
-            )
-            for i in [1, 2, 3, 4, 5]
-        ]
-        for sub in submissions:
-            session.add(sub)
-        session.commit()
-
-        bad_files = download_manager.get_bad_files(session)
-
-        assert len(bad_files) == 3  # Only 3, 4, 5
-        assert all(f.attempt_count >= 3 for f in bad_files)
-
-        session.close()
-
-    def test_get_failed_downloads_excludes_bad_files_by_default(self, test_db, download_manager):
-        """Test get_failed_downloads excludes bad files by default"""
-        engine, session_factory = test_db
-        session = session_factory()
-
-        tracking = MagazineTracking(olid="test", title="Test")
-        session.add(tracking)
-        session.commit()
-
-        # Create mix of failed downloads
-        submissions = [
-            DownloadSubmission(
-                tracking_id=tracking.id,
-                status=DownloadSubmission.StatusEnum.FAILED,
-                source_url=f"http://example.com/file{i}.nzb",
-                result_title=f"File {i}",
-                fuzzy_match_group=f"file-{i}",
-                attempt_count=i,
-            )
-            for i in [1, 2, 3, 4]
-        ]
-        for sub in submissions:
-            session.add(sub)
-        session.commit()
-
-        failed = download_manager.get_failed_downloads(session, include_bad_files=False)
-
-        assert len(failed) == 2  # Only 1 and 2
-        assert all(f.attempt_count < 3 for f in failed)
-
-        session.close()
-
-    def test_get_failed_downloads_includes_bad_files_when_requested(self, test_db, download_manager):
-        """Test get_failed_downloads includes bad files when include_bad_files=True"""
-        engine, session_factory = test_db
-        session = session_factory()
-
-        tracking = MagazineTracking(olid="test", title="Test")
-        session.add(tracking)
-        session.commit()
-
-        submissions = [
-            DownloadSubmission(
-                tracking_id=tracking.id,
-                status=DownloadSubmission.StatusEnum.FAILED,
-                source_url=f"http://example.com/file{i}.nzb",
-                result_title=f"File {i}",
-                fuzzy_match_group=f"file-{i}",
-                attempt_count=i,
-            )
-            for i in [1, 2, 3, 4]
-        ]
-        for sub in submissions:
-            session.add(sub)
-        session.commit()
-
-        failed = download_manager.get_failed_downloads(session, include_bad_files=True)
-
-        assert len(failed) == 4  # All failed downloads
-
-        session.close()
+    @pytest.mark.parametrize(
+        "query_fn,kwargs,expected_counts",
+        [
+            # get_bad_files returns only files with 3+ failures
+            ("get_bad_files", {}, {3, 4, 5}),
+            # get_failed_downloads excludes bad files unless asked for them
+            ("get_failed_downloads", {"include_bad_files": False}, {1, 2}),
+            ("get_failed_downloads", {"include_bad_files": True}, {1, 2, 3, 4, 5}),
+        ],
+    )
+    def test_failed_download_queries(self, db_session, tracking, download_manager, query_fn, kwargs, expected_counts):
+        """Test bad-file and failed-download queries split on the retry limit"""
+        _seed_failed(db_session, tracking.id, [1, 2, 3, 4, 5])
+
+        result = getattr(download_manager, query_fn)(db_session, **kwargs)
+
+        assert {f.attempt_count for f in result} == expected_counts
 
 
 class TestRetryPrevention:
     """Test that bad files are not retried"""
 
-    def test_bad_files_skipped_on_submit(self, test_db, download_manager):
+    def test_bad_files_skipped_on_submit(self, db_session, tracking, download_manager):
         """Test submit_download skips URLs that have failed 3+ times"""
-        engine, session_factory = test_db
-        session = session_factory()
-
-        tracking = MagazineTracking(olid="test", title="Test")
-        session.add(tracking)
-        session.commit()
-
         # Create a bad file record (3 failures)
         bad_submission = DownloadSubmission(
             tracking_id=tracking.id,
@@ -267,8 +204,8 @@ class TestRetryPrevention:
             attempt_count=3,
             last_error="Previous failure",
         )
-        session.add(bad_submission)
-        session.commit()
+        db_session.add(bad_submission)
+        db_session.commit()
 
         # Try to submit the same URL again
         search_result = {
@@ -277,22 +214,13 @@ class TestRetryPrevention:
             "provider": "test",
         }
 
-        result = download_manager.submit_download(tracking.id, search_result, session)
+        result = download_manager.submit_download(tracking.id, search_result, db_session)
 
         # Should be rejected (None)
         assert result is None
 
-        session.close()
-
-    def test_two_failures_still_allows_retry(self, test_db, download_manager, mock_download_client):
+    def test_two_failures_still_allows_retry(self, db_session, tracking, download_manager, download_client):
         """Test files with <3 failures can still be retried"""
-        engine, session_factory = test_db
-        session = session_factory()
-
-        tracking = MagazineTracking(olid="test", title="Test")
-        session.add(tracking)
-        session.commit()
-
         # Create a submission with 2 failures
         previous_submission = DownloadSubmission(
             tracking_id=tracking.id,
@@ -302,8 +230,8 @@ class TestRetryPrevention:
             fuzzy_match_group="retry-file",
             attempt_count=2,
         )
-        session.add(previous_submission)
-        session.commit()
+        db_session.add(previous_submission)
+        db_session.commit()
 
         # Try to submit the same URL again
         search_result = {
@@ -312,22 +240,13 @@ class TestRetryPrevention:
             "provider": "test",
         }
 
-        result = download_manager.submit_download(tracking.id, search_result, session)
+        result = download_manager.submit_download(tracking.id, search_result, db_session)
 
         # Should be allowed (not None)
         assert result is not None
 
-        session.close()
-
-    def test_max_retries_logged(self, test_db, download_manager, mock_download_client, caplog):
+    def test_max_retries_logged(self, db_session, tracking, download_manager, download_client, caplog):
         """Test that reaching max retries is logged"""
-        engine, session_factory = test_db
-        session = session_factory()
-
-        tracking = MagazineTracking(olid="test", title="Test")
-        session.add(tracking)
-        session.commit()
-
         submission = DownloadSubmission(
             tracking_id=tracking.id,
             job_id="job-max",
@@ -337,21 +256,15 @@ class TestRetryPrevention:
             fuzzy_match_group="max-file",
             attempt_count=2,
         )
-        session.add(submission)
-        session.commit()
+        db_session.add(submission)
+        db_session.commit()
 
         # Fail one more time to reach 3
-        mock_download_client.get_status.return_value = {"status": "failed", "error": "Final error"}
+        download_client.status_return = {"status": "failed", "error": "Final error"}
 
         with caplog.at_level("ERROR"):
-            result = download_manager.update_submission_status("job-max", session)
+            result = download_manager.update_submission_status("job-max", db_session)
 
         assert result.attempt_count == 3
         assert "Max retries reached" in caplog.text
         assert "marking as bad file" in caplog.text
-
-        session.close()
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
@@ -3,23 +3,15 @@ Test download monitor folder scanning functionality.
 Tests recursive PDF/EPUB discovery, statistics tracking, and file import integration.
 """
 
-import sys
-
-sys.path.insert(0, ".")
-
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, AsyncMock, patch
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 
 from scheduler import DownloadMonitorTask
 from services import DownloadManager
 from services import FileImporter
 from core.bases import DownloadClient
 from models.database import (
-    Base,
     Credentials,
     Download,
     DownloadSubmission,
@@ -29,20 +21,6 @@ from models.database import (
 )
 
 
-@pytest.fixture
-def test_db():
-    """Create in-memory test database"""
-    # Use StaticPool to keep the same connection for all threads
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool
-    )
-    Base.metadata.create_all(engine)
-    session_factory = sessionmaker(bind=engine)
-    return engine, session_factory
-
-
 @pytest.fixture
 def temp_downloads_dir(tmp_path):
     """Create temporary downloads directory structure"""
@@ -424,7 +402,3 @@ class TestMonitorTaskInitialization:
 
         # Should convert to Path
         assert isinstance(monitor.downloads_dir, Path)
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
@@ -0,0 +1,46 @@
+"""
+Test FileImporter batch imports.
+Tests that import_many isolates each file so one failure doesn't lose the rest.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from models.database import Magazine
+from services import FileImporter
+
+
+@pytest.fixture
+def importer(tmp_path):
+    """FileImporter over temporary download and organize directories"""
+    download_dir = tmp_path / "downloads"
+    organize_dir = tmp_path / "organized"
+    download_dir.mkdir()
+    organize_dir.mkdir()
+    return FileImporter(downloads_dir=str(download_dir), organize_base_dir=str(organize_dir))
+
+
+class TestImportMany:
+    """Test import_many savepoint handling"""
+
+    def test_failed_flush_keeps_other_imports(self, db_session, importer):
+        """Test a file whose flush fails is rolled back and the good file still commits"""
+        bad_file = importer.downloads_dir / "Wired UK - Jan2024.pdf"
+        good_file = importer.downloads_dir / "Time - Feb2024.pdf"
+        bad_file.write_text("bad issue")
+        good_file.write_text("good issue")
+
+        # An unrelated row already owns the bad file's organized path, so its INSERT
+        # violates the unique file_path constraint when import_pdf flushes
+        db_session.add(Magazine(
+            title="Other",
+            issue_date=datetime(2020, 1, 1),
+            file_path=str(importer.organize_base_dir / "_Magazines" / "Wired Uk" / "2024" / "Wired Uk - Jan2024.pdf"),
+        ))
+        db_session.commit()
+
+        imported = importer.import_many([bad_file, good_file], db_session, auto_track=False)
+
+        assert imported == 1
+        assert sorted(m.title for m in db_session.query(Magazine)) == ["Other", "Time"]
@@ -2,30 +2,16 @@
 Integration test for tracking merge functionality with library view grouping
 """
 
-import sys
 import tempfile
 from datetime import UTC, datetime
 from pathlib import Path
 
-import pytest
-from sqlalchemy import create_engine, func
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import func
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from models.database import Base, Magazine, MagazineTracking
+from models.database import Magazine, MagazineTracking
 from web.routers.tracking import merge_tracking, set_dependencies
 
 
-@pytest.fixture
-def test_db():
-    """Create in-memory test database"""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    session_factory = sessionmaker(bind=engine)
-    return engine, session_factory
-
-
 class TestTrackingMergeIntegration:
     """Integration test demonstrating full merge workflow"""
 
@@ -421,7 +407,3 @@ class TestTrackingMergeIntegration:
             assert not wired_mag_dir.exists(), "Empty source directory should be removed"
 
             session.close()
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v", "--tb=short"])
@@ -13,7 +13,6 @@ from core.constants import MAX_DOWNLOADS_PER_BATCH
 from core.database import DatabaseManager
 from core.factory import ClientFactory, ProviderFactory
 from core.parsers import TitleMatcher
-from models.database import MagazineTracking
 from services import DownloadManager, FileImporter, FileOrganizer
 from scheduler import TaskScheduler, DownloadMonitorTask, CoverCleanupTask
 
@@ -207,37 +206,15 @@ async def lifespan(app: FastAPI):
                             f"Auto-download: {remaining_slots} download slots available ({pending_count} already queued)"
                         )
 
-                        # Get all tracked periodicals with any form of tracking enabled
-                        tracked = (
-                            db_session.query(MagazineTracking)
-                            .filter(
-                                (MagazineTracking.track_all_editions.is_(True))
-                                | (MagazineTracking.track_new_only.is_(True))
-                            )
-                            .all()
-                        )
-
-                        # Also get periodicals with selected editions
-                        tracked_with_selections = (
-                            db_session.query(MagazineTracking)
-                            .filter(MagazineTracking.selected_editions.isnot(None))
-                            .all()
-                        )
-
-                        # Combine and deduplicate
-                        all_tracked = {t.id: t for t in tracked}
-                        for t in tracked_with_selections:
-                            if t.id not in all_tracked and t.selected_editions:
-                                # Check if any editions are actually selected (True values)
-                                if any(t.selected_editions.values()):
-                                    all_tracked[t.id] = t
+                        # Tracked periodicals with tracking enabled or editions selected
+                        all_tracked = download_manager.get_auto_download_tracking(db_session)
 
                         if all_tracked:
                             logger.info(
                                 f"Auto-download: Found {len(all_tracked)} periodicals to check"
                             )
 
-                            for periodical in all_tracked.values():
+                            for periodical in all_tracked:
                                 try:
                                     logger.debug(
                                         f"Auto-download: Checking '{periodical.title}' for new issues"
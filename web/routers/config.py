@@ -16,6 +16,12 @@ logger = logging.getLogger(__name__)
 # Global state (injected from main app)
 _config_loader = None
 
+# Placeholder the UI sends back for secrets it was only shown masked
+MASKED_VALUE = "***"
+
+# Config keys whose values are masked before being sent to the UI
+SENSITIVE_KEYS = frozenset({"api_key"})
+
 
 def set_dependencies(config_loader):
     """Set dependencies from main app"""
@@ -25,19 +31,26 @@ def set_dependencies(config_loader):
 
 def _mask_sensitive_config(config: Dict[str, Any]) -> Dict[str, Any]:
     """Mask sensitive data in config for UI display"""
-    masked = copy.deepcopy(config)
-
-    # Mask API keys in search providers
-    if "search_providers" in masked:
-        for provider in masked["search_providers"]:
-            if "api_key" in provider:
-                provider["api_key"] = "***" if provider["api_key"] else ""
-
-    # Mask download client API key
-    if "download_client" in masked and "api_key" in masked["download_client"]:
-        masked["download_client"]["api_key"] = (
-            "***" if masked["download_client"].get("api_key") else ""
-        )
+    masked: Dict[str, Any] = {}
+
+    # Copy iteratively, masking sensitive keys as they are copied
+    stack = [(config, masked)]
+    while stack:
+        source, target = stack.pop()
+        items = source.items() if type(source) is dict else enumerate(source)
+        for key, value in items:
+            value_type = type(value)
+            if key in SENSITIVE_KEYS and value_type is not dict and value_type is not list:
+                copied = MASKED_VALUE if value else ""
+            elif value_type is dict:
+                copied = {}
+                stack.append((value, copied))
+            elif value_type is list:
+                copied = [None] * len(value)
+                stack.append((value, copied))
+            else:
+                copied = copy.deepcopy(value)
+            target[key] = copied
 
     return masked
 
@@ -47,42 +60,31 @@ def _deep_merge(base: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
     result = base.copy()
 
     for key, value in update.items():
-        if key in result:
-            if isinstance(result[key], list) and isinstance(value, list):
-                # For search_providers, preserve original API keys where they're masked
-                if key == "search_providers":
-                    # Create new list to avoid modifying the input
-                    merged_list = []
-                    for i, provider in enumerate(value):
-                        provider_copy = provider.copy()
-                        # If the API key is masked and there's an original, use the original
-                        if provider_copy.get("api_key") == "***" and i < len(result[key]):
-                            original_key = result[key][i].get("api_key", "")
-                            provider_copy["api_key"] = original_key
-                        merged_list.append(provider_copy)
-                    result[key] = merged_list
-                else:
-                    # For other lists, replace entirely
-                    result[key] = value
-            elif isinstance(result[key], dict) and isinstance(value, dict):
-                # For dicts, recursively merge
-                result[key] = _deep_merge(result[key], value)
+        current = result.get(key)
+        value_type = type(value)
+        if value_type is list and type(current) is list:
+            # For search_providers, preserve original API keys where they're masked
+            if key == "search_providers":
+                # Create new list to avoid modifying the input
+                merged_list = [provider.copy() for provider in value]
+                # If the API key is masked and there's an original, use the original
+                for provider, original in zip(merged_list, current):
+                    if provider.get("api_key") == MASKED_VALUE:
+                        provider["api_key"] = original.get("api_key", "")
+                result[key] = merged_list
             else:
-                # For primitives, replace
+                # For other lists, replace entirely
                 result[key] = value
+        elif value_type is dict and type(current) is dict:
+            # For dicts, recursively merge
+            result[key] = _deep_merge(current, value)
+        elif key in SENSITIVE_KEYS and value == MASKED_VALUE:
+            # Masked secret sent back from the UI; keep the original
+            result[key] = current if current is not None else ""
         else:
+            # For primitives and new keys, replace
             result[key] = value
 
-    # Preserve download client API key if masked
-    if (
-        "download_client" in update
-        and update["download_client"].get("api_key") == "***"
-    ):
-        if "download_client" in base:
-            result["download_client"]["api_key"] = base["download_client"].get(
-                "api_key", ""
-            )
-
     return result
 
 
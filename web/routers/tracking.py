@@ -565,8 +565,6 @@ async def merge_tracking(target_id: int, source_ids: Dict[str, list[int]]) -> Di
             if len(sources) != len(source_id_list):
                 raise HTTPException(status_code=404, detail="One or more source tracking records not found")
 
-            magazines_moved = 0
-            submissions_moved = 0
             files_reorganized = 0
             directories_to_cleanup = set()
 
@@ -575,63 +573,63 @@ async def merge_tracking(target_id: int, source_ids: Dict[str, list[int]]) -> Di
             organize_base_dir = Path("./local/data").resolve()
             category_prefix = "_"
 
-            # Move magazines from source to target
-            for source in sources:
-                # Update magazines to point to target tracking and normalize title
-                magazines = db_session.query(Magazine).filter(Magazine.tracking_id == source.id).all()
-                for magazine in magazines:
-                    magazine.tracking_id = target.id
-
-                    # Only update title if this is NOT a special edition
-                    # Special editions need to keep their distinct title to be grouped separately
-                    is_special = False
-                    if magazine.extra_metadata and isinstance(magazine.extra_metadata, dict):
-                        is_special = magazine.extra_metadata.get("special_edition") is not None
-
-                    # Also check title using the is_special_edition function
-                    if not is_special:
-                        is_special = is_special_edition(magazine.title)
-
-                    # Only normalize title and reorganize files for regular editions
-                    if not is_special:
-                        # Store old directory for cleanup
-                        old_pdf_path = Path(magazine.file_path)
-                        if old_pdf_path.exists():
-                            directories_to_cleanup.add(old_pdf_path.parent)
-
-                        # Reorganize files to match new title structure
-                        new_pdf_path, new_cover_path = _reorganize_magazine_files(
-                            magazine,
-                            target.title,
-                            organize_base_dir,
-                            category_prefix
-                        )
-
-                        # Update database paths if reorganization succeeded
-                        if new_pdf_path:
-                            magazine.file_path = new_pdf_path
-                            if new_cover_path:
-                                magazine.cover_path = new_cover_path
-                            files_reorganized += 1
-                            logger.info(f"Reorganized files for: {magazine.title} ({magazine.issue_date.strftime('%b %Y')})")
-                        else:
-                            logger.warning(f"Failed to reorganize files for magazine ID {magazine.id}, keeping original paths")
-
-                        # Update title after file operations
-                        magazine.title = target.title
-
-                    magazines_moved += 1
-
-                # Update download submissions to point to target tracking
-                submissions = (
-                    db_session.query(DownloadSubmission).filter(DownloadSubmission.tracking_id == source.id).all()
-                )
-                for submission in submissions:
-                    submission.tracking_id = target.id
-                    submissions_moved += 1
+            # Move magazines from all sources to target in one pass
+            magazines = db_session.query(Magazine).filter(Magazine.tracking_id.in_(source_id_list)).all()
+            for magazine in magazines:
+                magazine.tracking_id = target.id
+
+                # Only update title if this is NOT a special edition
+                # Special editions need to keep their distinct title to be grouped separately
+                is_special = False
+                if magazine.extra_metadata and isinstance(magazine.extra_metadata, dict):
+                    is_special = magazine.extra_metadata.get("special_edition") is not None
+
+                # Also check title using the is_special_edition function
+                if not is_special:
+                    is_special = is_special_edition(magazine.title)
+
+                # Only normalize title and reorganize files for regular editions
+                if not is_special:
+                    # Store old directory for cleanup
+                    old_pdf_path = Path(magazine.file_path)
+                    if old_pdf_path.exists():
+                        directories_to_cleanup.add(old_pdf_path.parent)
+
+                    # Reorganize files to match new title structure
+                    new_pdf_path, new_cover_path = _reorganize_magazine_files(
+                        magazine,
+                        target.title,
+                        organize_base_dir,
+                        category_prefix
+                    )
 
-                # Delete source tracking record
-                db_session.delete(source)
+                    # Update database paths if reorganization succeeded
+                    if new_pdf_path:
+                        magazine.file_path = new_pdf_path
+                        if new_cover_path:
+                            magazine.cover_path = new_cover_path
+                        files_reorganized += 1
+                        logger.info(f"Reorganized files for: {magazine.title} ({magazine.issue_date.strftime('%b %Y')})")
+                    else:
+                        logger.warning(f"Failed to reorganize files for magazine ID {magazine.id}, keeping original paths")
+
+                    # Update title after file operations
+                    magazine.title = target.title
+
+            magazines_moved = len(magazines)
+            # Magazines must point at the target before their old tracking rows are deleted
+            db_session.flush()
+
+            # Repoint download submissions and delete the sources with single statements
+            submissions_moved = (
+                db_session.query(DownloadSubmission)
+                .filter(DownloadSubmission.tracking_id.in_(source_id_list))
+                .update({DownloadSubmission.tracking_id: target.id}, synchronize_session=False)
+            )
+            source_titles = [s.title for s in sources]
+            db_session.query(MagazineTracking).filter(MagazineTracking.id.in_(source_id_list)).delete(
+                synchronize_session=False
+            )
 
             db_session.commit()
 
@@ -640,7 +638,6 @@ async def merge_tracking(target_id: int, source_ids: Dict[str, list[int]]) -> Di
                 if directory.exists():
                     _cleanup_empty_directories(directory, organize_base_dir)
 
-            source_titles = [s.title for s in sources]
             logger.info(
                 f"Merged {len(sources)} tracking records ({', '.join(source_titles)}) into '{target.title}' (ID: {target_id}). "
                 f"Moved {magazines_moved} magazines, reorganized {files_reorganized} files."